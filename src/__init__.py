@@ -9,6 +9,8 @@ and format-conversion tools.
 __version__ = "0.1.0"
 __author__ = "Andrii Popesku"
 
+from importlib import import_module as _import_module
+
 # Core domain exports
 from .core.timeline import Timeline
 from .core.track import Track, TrackType
@@ -71,21 +73,24 @@ __all__ = [
     "create_simple_video",
 ]
 
-# Adapter imports (optional dependencies)
-try:
-    from .adapters.moviepy_renderer import MoviePyRenderer
-    __all__.append("MoviePyRenderer")
-except ImportError:
-    pass
+# Adapters wrap optional, heavy dependencies (MoviePy, OpenTimelineIO, Groq),
+# so they are imported on first access instead of with the package (PEP 562)
+_ADAPTERS = {
+    "MoviePyRenderer": ".adapters.moviepy_renderer",
+    "OTIOFormatter": ".adapters.otio_formatter",
+    "GroqWhisperTranscriber": ".adapters.groq_whisper_transcriber",
+}
+__all__ += list(_ADAPTERS)
+
+
+def __getattr__(name):
+    module_name = _ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
 
-try:
-    from .adapters.otio_formatter import OTIOFormatter
-    __all__.append("OTIOFormatter")
-except ImportError:
-    pass
 
-try:
-    from .adapters.groq_whisper_transcriber import GroqWhisperTranscriber
-    __all__.append("GroqWhisperTranscriber")
-except ImportError:
-    pass
+def __dir__():
+    return sorted(set(globals()) | set(_ADAPTERS))
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the supported Python versions.
+"""
+import sys
+
+
+# Keyword arguments for slotted dataclasses, which need Python 3.10; older
+# versions fall back to regular dataclasses with a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -349,15 +349,20 @@ class GroqWhisperTranscriber(TranscriptionService):
         
         for segment in segments[1:]:
             if current_segment.duration < min_duration:
-                # Merge with next segment
+                # Merge with next segment, keeping the lowest known confidence
+                current_conf, next_conf = current_segment.confidence, segment.confidence
+                if next_conf is None:
+                    confidence = current_conf
+                elif current_conf is None or next_conf < current_conf:
+                    confidence = next_conf
+                else:
+                    confidence = current_conf
+                
                 current_segment = SubtitleSegment(
                     text=f"{current_segment.text} {segment.text}",
                     start_time=current_segment.start_time,
                     end_time=segment.end_time,
-                    confidence=min(
-                        current_segment.confidence or 1.0,
-                        segment.confidence or 1.0
-                    ) if current_segment.confidence and segment.confidence else None,
+                    confidence=confidence,
                     language=current_segment.language
                 )
             else:
@@ -21,6 +21,58 @@ except ImportError:
     otio = None
 
 
+# Capabilities per format, built once and shared by every formatter
+_FORMAT_CAPABILITIES = {
+    SupportedFormat.OTIO_JSON: FormatCapability(
+        supports_video=True,
+        supports_audio=True,
+        supports_text=True,
+        supports_transitions=True,
+        supports_effects=True,
+        supports_metadata=True,
+        supports_markers=True,
+    ),
+    SupportedFormat.FCPXML: FormatCapability(
+        supports_video=True,
+        supports_audio=True,
+        supports_text=True,
+        supports_transitions=True,
+        supports_effects=False,  # Limited
+        supports_metadata=True,
+        supports_markers=True,
+    ),
+    SupportedFormat.ALE: FormatCapability(
+        supports_video=False,
+        supports_audio=False,
+        supports_text=False,
+        supports_transitions=False,
+        supports_effects=False,
+        supports_metadata=True,
+        supports_markers=False,
+        read_only=True,  # ALE is primarily metadata
+    ),
+    SupportedFormat.EDL: FormatCapability(
+        supports_video=True,
+        supports_audio=True,
+        supports_text=False,
+        supports_transitions=True,
+        supports_effects=False,
+        supports_metadata=False,
+        supports_markers=False,
+    ),
+    SupportedFormat.AAF: FormatCapability(
+        supports_video=True,
+        supports_audio=True,
+        supports_text=False,  # Limited
+        supports_transitions=True,
+        supports_effects=True,
+        supports_metadata=True,
+        supports_markers=True,
+    ),
+}
+_DEFAULT_CAPABILITY = FormatCapability()
+
+
 class OTIOFormatter(TimelineFormat):
     """
     OpenTimelineIO-based formatter implementing the TimelineFormat port.
@@ -29,6 +81,8 @@ class OTIOFormatter(TimelineFormat):
     like Final Cut Pro XML, AAF, EDL, and OTIO's native JSON format.
     """
     
+    primary_format = SupportedFormat.OTIO_JSON
+    
     def __init__(self):
         """Initialize the OTIO formatter."""
         if not OTIO_AVAILABLE:
@@ -191,56 +245,7 @@ class OTIOFormatter(TimelineFormat):
         Returns:
             Capability description for the format
         """
-        capabilities = {
-            SupportedFormat.OTIO_JSON: FormatCapability(
-                supports_video=True,
-                supports_audio=True,
-                supports_text=True,
-                supports_transitions=True,
-                supports_effects=True,
-                supports_metadata=True,
-                supports_markers=True,
-            ),
-            SupportedFormat.FCPXML: FormatCapability(
-                supports_video=True,
-                supports_audio=True,
-                supports_text=True,
-                supports_transitions=True,
-                supports_effects=False,  # Limited
-                supports_metadata=True,
-                supports_markers=True,
-            ),
-            SupportedFormat.ALE: FormatCapability(
-                supports_video=False,
-                supports_audio=False,
-                supports_text=False,
-                supports_transitions=False,
-                supports_effects=False,
-                supports_metadata=True,
-                supports_markers=False,
-                read_only=True,  # ALE is primarily metadata
-            ),
-            SupportedFormat.EDL: FormatCapability(
-                supports_video=True,
-                supports_audio=True,
-                supports_text=False,
-                supports_transitions=True,
-                supports_effects=False,
-                supports_metadata=False,
-                supports_markers=False,
-            ),
-            SupportedFormat.AAF: FormatCapability(
-                supports_video=True,
-                supports_audio=True,
-                supports_text=False,  # Limited
-                supports_transitions=True,
-                supports_effects=True,
-                supports_metadata=True,
-                supports_markers=True,
-            ),
-        }
-        
-        return capabilities.get(format_type, FormatCapability())
+        return _FORMAT_CAPABILITIES.get(format_type, _DEFAULT_CAPABILITY)
     
     def get_name(self) -> str:
         """Get the name of this format adapter."""
@@ -397,21 +402,21 @@ class OTIOFormatter(TimelineFormat):
                     path = Path(source_path)
                     ext = path.suffix.lower()
                     
-                    if ext in ['.mp4', '.mov', '.avi', '.mkv', '.webm']:
+                    if ext in {'.mp4', '.mov', '.avi', '.mkv', '.webm'}:
                         return VideoClip(
                             source_path=source_path,
                             start_time=start_time,
                             duration=duration,
                             name=otio_clip.name
                         )
-                    elif ext in ['.wav', '.mp3', '.m4a', '.aac']:
+                    elif ext in {'.wav', '.mp3', '.m4a', '.aac'}:
                         return AudioClip(
                             source_path=source_path,
                             start_time=start_time,
                             duration=duration,
                             name=otio_clip.name
                         )
-                    elif ext in ['.jpg', '.jpeg', '.png', '.tiff']:
+                    elif ext in {'.jpg', '.jpeg', '.png', '.tiff'}:
                         return ImageClip(
                             source_path=source_path,
                             duration=duration or 5.0,  # Default duration for images
@@ -535,7 +540,7 @@ class OTIOFormatter(TimelineFormat):
             )
             
             # Add transition-specific metadata
-            otio_transition.metadata = transition.get_parameters()
+            otio_transition.metadata = dict(transition.get_parameters())
             
             return otio_transition
             
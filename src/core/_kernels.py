@@ -0,0 +1,303 @@
+"""
+Numeric kernels for clip time queries.
+
+These operate on the parallel start/end time arrays kept by tracks. NumPy is
+used when it is installed; otherwise the pure-Python fallbacks are used.
+Numba, when installed, compiles the frame-by-clip activity kernel.
+
+Both are imported on first use rather than with aive, since importing NumPy
+alone takes longer than importing the rest of the package.
+"""
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+
+# Below this many clips the interpreter loop is faster than NumPy's call overhead
+VECTORIZE_THRESHOLD = 64
+
+# From this many clips a StabIndex beats a full scan for repeated queries; a
+# NumPy scan stays faster than the pure-Python tree up to much larger tracks
+INDEX_THRESHOLD = 16384 if NUMPY_AVAILABLE else 256
+
+
+def stab(starts: array, ends: array, time: float) -> List[int]:
+    """
+    Find the indices of all intervals containing a point in time.
+
+    Args:
+        starts: Interval start times
+        ends: Interval end times (exclusive), same length as starts
+        time: Time in seconds to check
+
+    Returns:
+        Ascending indices i where starts[i] <= time < ends[i]
+    """
+    if NUMPY_AVAILABLE and len(starts) >= VECTORIZE_THRESHOLD:
+        import numpy as np
+        
+        # Zero-copy views over the array buffers
+        start_view = np.frombuffer(starts, dtype=np.float64)
+        end_view = np.frombuffer(ends, dtype=np.float64)
+        return np.flatnonzero((start_view <= time) & (end_view > time)).tolist()
+
+    return [
+        i for i, (start, end) in enumerate(zip(starts, ends))
+        if start <= time < end
+    ]
+
+
+numba = None  # Bound on first use by _compiled_active_mask
+
+
+def _fill_active_mask(starts, ends, times, out):  # pragma: no cover - compiled
+    for f in numba.prange(times.shape[0]):
+        t = times[f]
+        for i in range(starts.shape[0]):
+            out[f, i] = starts[i] <= t and ends[i] > t
+
+
+@lru_cache(maxsize=None)
+def _compiled_active_mask() -> Callable:
+    """Compile _fill_active_mask with Numba on first use."""
+    global numba
+    import numba
+    
+    return numba.njit(parallel=True, cache=True)(_fill_active_mask)
+
+
+def active_mask(starts: array, ends: array, times: 'np.ndarray') -> 'np.ndarray':
+    """
+    Evaluate which intervals contain each of many points in time.
+    
+    Args:
+        starts: Interval start times
+        ends: Interval end times (exclusive), same length as starts
+        times: Points in time in seconds
+        
+    Returns:
+        Boolean array of shape (len(times), len(starts)) whose entry [f, i]
+        is starts[i] <= times[f] < ends[i]
+        
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy is required for clip activity masks. "
+            "Install it with: pip install numpy"
+        )
+    import numpy as np
+    
+    start_view = np.frombuffer(starts, dtype=np.float64)
+    end_view = np.frombuffer(ends, dtype=np.float64)
+    times = np.ascontiguousarray(times, dtype=np.float64).reshape(-1)
+    if NUMBA_AVAILABLE:
+        out = np.empty((len(times), len(start_view)), dtype=np.bool_)
+        _compiled_active_mask()(start_view, end_view, times, out)
+        return out
+    
+    column = times[:, None]
+    return (start_view <= column) & (end_view > column)
+
+
+def latest_end(ends: array) -> float:
+    """
+    Find the latest interval end time.
+    
+    Args:
+        ends: Interval end times
+        
+    Returns:
+        The maximum end time, or -inf if there are no intervals
+    """
+    if not ends:
+        return float('-inf')
+    if NUMPY_AVAILABLE and len(ends) >= VECTORIZE_THRESHOLD:
+        import numpy as np
+        
+        return float(np.frombuffer(ends, dtype=np.float64).max())
+    return max(ends)
+
+
+class SortedStabIndex:
+    """
+    Point-query index for intervals already in ascending start order.
+    
+    Stores the running maximum of end times, so a query binary-searches for
+    the last interval starting at or before the time and walks backwards
+    only while an earlier interval can still be running. On tracks without
+    overlaps that is O(log n + 1). The index shares the arrays it was built
+    from; rebuild it after edits.
+    """
+    
+    __slots__ = ('_starts', '_ends', '_max_ends')
+    
+    def __init__(self, starts: array, ends: array, max_ends: array) -> None:
+        """
+        Wrap prepared arrays; use from_sorted to build an index.
+        
+        Args:
+            starts: Interval start times in ascending order
+            ends: Interval end times (exclusive), same length as starts
+            max_ends: Entry i is the maximum of ends[:i + 1]
+        """
+        self._starts = starts
+        self._ends = ends
+        self._max_ends = max_ends
+    
+    @classmethod
+    def from_sorted(cls, starts: array, ends: array) -> Optional['SortedStabIndex']:
+        """
+        Build the index if the intervals are sorted by start time.
+        
+        Args:
+            starts: Interval start times
+            ends: Interval end times (exclusive), same length as starts
+            
+        Returns:
+            The index, or None if starts is not in ascending order
+        """
+        max_ends = array('d', ends)
+        previous_start = float('-inf')
+        running = float('-inf')
+        for i, start in enumerate(starts):
+            if start < previous_start:
+                return None
+            previous_start = start
+            end = max_ends[i]
+            if end > running:
+                running = end
+            else:
+                max_ends[i] = running
+        return cls(starts, ends, max_ends)
+    
+    def query(self, time: float) -> List[int]:
+        """
+        Find the intervals containing a point in time.
+        
+        Args:
+            time: Time in seconds to check
+            
+        Returns:
+            Ascending indices i where starts[i] <= time < ends[i]
+        """
+        ends = self._ends
+        max_ends = self._max_ends
+        hits = []
+        i = bisect_right(self._starts, time) - 1
+        while i >= 0 and max_ends[i] > time:
+            if ends[i] > time:
+                hits.append(i)
+            i -= 1
+        hits.reverse()
+        return hits
+
+
+class StabIndex:
+    """
+    Static interval index answering point queries in O(log n + m).
+    
+    Intervals are sorted by start time and laid out as an implicit balanced
+    binary tree (the cgranges layout): the node at sorted position i has
+    level equal to its number of trailing one bits, and each node stores
+    the maximum end time within its subtree so whole subtrees that end too
+    early are skipped. The index is immutable; rebuild it after edits.
+    """
+    
+    __slots__ = ('_order', '_starts', '_ends', '_max_ends', '_max_level')
+    
+    # Subtrees at or below this level are scanned linearly
+    _SCAN_LEVEL = 3
+    
+    def __init__(self, starts: array, ends: array) -> None:
+        """
+        Build the index.
+        
+        Args:
+            starts: Interval start times
+            ends: Interval end times (exclusive), same length as starts
+        """
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        # Typed arrays take 8 bytes per entry where lists of floats take 32
+        self._order = array('q', order)
+        self._starts = array('d', [starts[i] for i in order])
+        ends_sorted = [ends[i] for i in order]
+        self._ends = array('d', ends_sorted)
+        
+        n = len(order)
+        if n == 0:
+            self._max_ends = array('d')
+            self._max_level = -1
+            return
+        
+        # Bottom-up pass over each level, as in cgranges' cr_index_core; the
+        # pass works on lists, which index faster than arrays
+        max_ends = list(ends_sorted)
+        last_i = (n - 1) & ~1
+        last = max_ends[last_i]
+        level = 1
+        while (1 << level) <= n:
+            x = 1 << (level - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                left = max_ends[i - x]
+                right = max_ends[i + x] if i + x < n else last
+                max_ends[i] = max(ends_sorted[i], left, right)
+            last_i = last_i - x if (last_i >> level) & 1 else last_i + x
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            level += 1
+        self._max_ends = array('d', max_ends)
+        self._max_level = level - 1
+    
+    def query(self, time: float) -> List[int]:
+        """
+        Find the intervals containing a point in time.
+        
+        Args:
+            time: Time in seconds to check
+            
+        Returns:
+            Ascending original indices i where starts[i] <= time < ends[i]
+        """
+        if self._max_level < 0:
+            return []
+        
+        starts = self._starts
+        ends = self._ends
+        max_ends = self._max_ends
+        n = len(starts)
+        hits = []
+        
+        # Stack entries: (level, node position, whether the left child was visited)
+        stack = [(self._max_level, (1 << self._max_level) - 1, False)]
+        while stack:
+            level, x, left_done = stack.pop()
+            if level <= self._SCAN_LEVEL:
+                # Small subtree: scan its positions in start order
+                i0 = (x >> level) << level
+                for i in range(i0, min(i0 + (1 << (level + 1)) - 1, n)):
+                    if starts[i] > time:
+                        break
+                    if ends[i] > time:
+                        hits.append(i)
+            elif not left_done:
+                stack.append((level, x, True))
+                y = x - (1 << (level - 1))
+                if y >= n or max_ends[y] > time:
+                    stack.append((level - 1, y, False))
+            elif x < n and starts[x] <= time:
+                if ends[x] > time:
+                    hits.append(x)
+                stack.append((level - 1, x + (1 << (level - 1)), False))
+        
+        order = self._order
+        return sorted(order[i] for i in hits)
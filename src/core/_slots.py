@@ -0,0 +1,62 @@
+"""
+State helpers for classes that use __slots__.
+
+Slotted instances have no __dict__ to copy, so classes that customize
+copying and pickling use these to gather and restore every slot value
+(plus the __dict__ of subclasses that do not declare slots).
+"""
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+
+@lru_cache(maxsize=None)
+def slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get the names of all data slots declared along a class's MRO.
+
+    Args:
+        cls: Class to inspect
+
+    Returns:
+        Slot names, excluding __dict__ and __weakref__
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def get_slot_state(obj: Any) -> Dict[str, Any]:
+    """
+    Collect an object's attribute values from its slots and any __dict__.
+
+    Args:
+        obj: Object to read
+
+    Returns:
+        Mapping of attribute name to value for every attribute that is set
+    """
+    state = dict(getattr(obj, '__dict__', ()))
+    for name in slot_names(type(obj)):
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass  # Slot never assigned
+    return state
+
+
+def set_slot_state(obj: Any, state: Dict[str, Any]) -> None:
+    """
+    Restore attribute values collected by get_slot_state.
+
+    Args:
+        obj: Object to update
+        state: Mapping of attribute name to value
+    """
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
@@ -1,37 +1,97 @@
 """
 Core clip classes representing different types of media content.
 """
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
+from .._compat import DATACLASS_SLOTS
+from ._slots import get_slot_state, set_slot_state
 
-@dataclass
-class Position:
+if TYPE_CHECKING:
+    from .track import Track
+
+
+class _ValueType:
+    """Mixin for immutable value types; copying returns the same instance."""
+    
+    __slots__ = ()
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        return self
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Position(_ValueType):
     """Represents a 2D position on screen."""
     x: float
     y: float
 
 
-@dataclass
-class Size:
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Size(_ValueType):
     """Represents width and height dimensions."""
     width: float
     height: float
 
 
-@dataclass
-class Color:
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Color(_ValueType):
     """Represents an RGB color."""
     r: int
     g: int 
     b: int
     a: int = 255  # Alpha channel, 0-255
+    _hex: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_hex(self) -> str:
         """Convert color to hex string."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        hex_str = self._hex
+        if hex_str is None:
+            try:
+                hex_str = '#' + bytes((self.r, self.g, self.b)).hex()
+            except ValueError:
+                # Channels are not validated; format out-of-range ones as before
+                hex_str = f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+            object.__setattr__(self, '_hex', hex_str)
+        return hex_str
+
+
+class _LazyPath:
+    """
+    Descriptor for clip source paths that stores the value as given.
+    
+    Path parsing is deferred to the first read, so building many media clips
+    only keeps their path strings.
+    """
+    
+    __slots__ = ()
+    
+    def __get__(self, clip: Optional['Clip'], owner: type) -> Any:
+        if clip is None:
+            return self
+        path = clip._source_path
+        if not isinstance(path, Path):
+            path = clip._source_path = Path(path)
+        return path
+    
+    def __set__(self, clip: 'Clip', value: Union[str, Path]) -> None:
+        clip._source_path = value
+
+
+# Shared defaults; value types are immutable, so one instance serves every clip.
+# Clips that leave the color unset also reuse one cached hex string.
+_WHITE = Color(255, 255, 255)
+_ORIGIN = Position(0, 0)
+
+# Released clips per concrete class, reused by Clip.acquire
+_CLIP_POOLS: Dict[type, List['Clip']] = {}
+_CLIP_POOL_LIMIT = 1024
 
 
 class Clip(ABC):
@@ -42,6 +102,8 @@ class Clip(ABC):
     on a timeline track with specific timing and properties.
     """
     
+    __slots__ = ('_track', '_pos', '_start_time', '_duration', '_end_time', 'name', '_properties')
+    
     def __init__(
         self,
         start_time: float = 0.0,
@@ -56,24 +118,107 @@ class Clip(ABC):
             duration: How long the clip lasts (in seconds)
             name: Optional name for the clip
         """
-        self.start_time = start_time
-        self.duration = duration
+        # Weak reference to the owning track and position within it, kept in sync
+        # by the track so timing changes and removals don't need a scan
+        self._track: Optional['weakref.ReferenceType[Track]'] = None
+        self._pos = -1
+        self._start_time = start_time
+        self._duration = duration
+        self._end_time = None if duration is None else start_time + duration
         self.name = name
-        self._properties: Dict[str, Any] = {}
+        self._properties: Optional[Dict[str, Any]] = None  # Allocated on first set_property
+    
+    @property
+    def start_time(self) -> float:
+        """When the clip starts on the timeline (in seconds)."""
+        return self._start_time
+    
+    @start_time.setter
+    def start_time(self, value: float) -> None:
+        self._start_time = value
+        self._end_time = None if self._duration is None else value + self._duration
+        self._notify_track()
+    
+    @property
+    def duration(self) -> Optional[float]:
+        """How long the clip lasts (in seconds)."""
+        return self._duration
+    
+    @duration.setter
+    def duration(self, value: Optional[float]) -> None:
+        self._duration = value
+        self._end_time = None if value is None else self._start_time + value
+        self._notify_track()
     
     @property
     def end_time(self) -> float:
         """Calculate the end time of the clip."""
-        if self.duration is None:
+        end_time = self._end_time  # Maintained by the start_time and duration setters
+        if end_time is None:
             raise ValueError("Cannot calculate end_time without duration")
-        return self.start_time + self.duration
+        return end_time
+    
+    @classmethod
+    def acquire(cls, *args: Any, **kwargs: Any) -> 'Clip':
+        """
+        Create a clip, reusing a released instance of this class if one is pooled.
+        
+        Args:
+            *args: Constructor arguments
+            **kwargs: Constructor keyword arguments
+            
+        Returns:
+            A freshly initialized clip
+        """
+        try:
+            clip = _CLIP_POOLS[cls].pop()
+        except (KeyError, IndexError):
+            return cls(*args, **kwargs)
+        clip.__init__(*args, **kwargs)
+        return clip
+    
+    def release(self) -> None:
+        """
+        Return the clip to its class's pool for reuse by acquire.
+        
+        The clip must not be used, or released again, afterwards.
+        
+        Raises:
+            ValueError: If the clip is still on a track
+        """
+        if self._track is not None and self._track() is not None:
+            raise ValueError("Cannot release a clip that is still on a track")
+        pool = _CLIP_POOLS.setdefault(type(self), [])
+        if len(pool) < _CLIP_POOL_LIMIT:
+            pool.append(self)
+    
+    def _notify_track(self) -> None:
+        """Let the owning track refresh its cached timing for this clip."""
+        track = self._track() if self._track is not None else None
+        if track is not None:
+            track._update_clip_times(self)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the track back-reference; the owning track re-binds on restore."""
+        state = get_slot_state(self)
+        state['_track'] = None
+        state['_pos'] = -1
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a copied or unpickled clip."""
+        set_slot_state(self, state)
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property on the clip."""
+        if self._properties is None:
+            self._properties = {}
         self._properties[key] = value
     
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property from the clip."""
+        if self._properties is None:
+            return default
         return self._properties.get(key, default)
     
     @abstractmethod
@@ -90,6 +235,13 @@ class VideoClip(Clip):
     video content on the timeline.
     """
     
+    __slots__ = (
+        '_source_path', 'trim_start', 'trim_end', 'scale', 'position',
+        'opacity', 'rotation', 'crop_box',
+    )
+    
+    source_path = _LazyPath()
+    
     def __init__(
         self,
         source_path: str,
@@ -115,11 +267,11 @@ class VideoClip(Clip):
             name: Optional name for the clip
         """
         super().__init__(start_time, duration, name)
-        self.source_path = Path(source_path)
+        self._source_path = source_path  # Parsed into a Path on first read
         self.trim_start = trim_start
         self.trim_end = trim_end
         self.scale = scale
-        self.position = position or Position(0, 0)
+        self.position = position or _ORIGIN
         
         # Video-specific properties
         self.opacity = 1.0
@@ -131,7 +283,7 @@ class VideoClip(Clip):
     
     def set_opacity(self, opacity: float) -> 'VideoClip':
         """Set the opacity of the video clip (0.0 to 1.0)."""
-        self.opacity = max(0.0, min(1.0, opacity))
+        self.opacity = 0.0 if opacity < 0.0 else opacity if opacity <= 1.0 else 1.0
         return self
     
     def set_rotation(self, degrees: float) -> 'VideoClip':
@@ -153,6 +305,13 @@ class AudioClip(Clip):
     volume control and audio effects.
     """
     
+    __slots__ = (
+        '_source_path', 'trim_start', 'trim_end', 'volume',
+        'fade_in_duration', 'fade_out_duration', 'muted',
+    )
+    
+    source_path = _LazyPath()
+    
     def __init__(
         self,
         source_path: str,
@@ -176,7 +335,7 @@ class AudioClip(Clip):
             name: Optional name for the clip
         """
         super().__init__(start_time, duration, name)
-        self.source_path = Path(source_path)
+        self._source_path = source_path  # Parsed into a Path on first read
         self.trim_start = trim_start
         self.trim_end = trim_end
         self.volume = volume
@@ -191,17 +350,17 @@ class AudioClip(Clip):
     
     def set_volume(self, volume: float) -> 'AudioClip':
         """Set the volume of the audio clip."""
-        self.volume = max(0.0, volume)
+        self.volume = volume if volume > 0.0 else 0.0
         return self
     
     def set_fade_in(self, duration: float) -> 'AudioClip':
         """Set fade-in duration in seconds."""
-        self.fade_in_duration = max(0.0, duration)
+        self.fade_in_duration = duration if duration > 0.0 else 0.0
         return self
     
     def set_fade_out(self, duration: float) -> 'AudioClip':
         """Set fade-out duration in seconds."""
-        self.fade_out_duration = max(0.0, duration)
+        self.fade_out_duration = duration if duration > 0.0 else 0.0
         return self
     
     def mute(self, muted: bool = True) -> 'AudioClip':
@@ -217,6 +376,10 @@ class ImageClip(Clip):
     Can be used for still images, logos, or other static visual content.
     """
     
+    __slots__ = ('_source_path', 'scale', 'position', 'opacity', 'rotation')
+    
+    source_path = _LazyPath()
+    
     def __init__(
         self,
         source_path: str,
@@ -238,9 +401,9 @@ class ImageClip(Clip):
             name: Optional name for the clip
         """
         super().__init__(start_time, duration, name)
-        self.source_path = Path(source_path)
+        self._source_path = source_path  # Parsed into a Path on first read
         self.scale = scale
-        self.position = position or Position(0, 0)
+        self.position = position or _ORIGIN
         
         # Image-specific properties
         self.opacity = 1.0
@@ -251,7 +414,7 @@ class ImageClip(Clip):
     
     def set_opacity(self, opacity: float) -> 'ImageClip':
         """Set the opacity of the image clip."""
-        self.opacity = max(0.0, min(1.0, opacity))
+        self.opacity = 0.0 if opacity < 0.0 else opacity if opacity <= 1.0 else 1.0
         return self
     
     def set_rotation(self, degrees: float) -> 'ImageClip':
@@ -267,6 +430,11 @@ class TextClip(Clip):
     Can be used for titles, subtitles, captions, or other text content.
     """
     
+    __slots__ = (
+        'text', 'font_size', 'font_family', 'color', 'position', 'size', 'bold',
+        'italic', 'underline', 'alignment', 'background_color', 'opacity',
+    )
+    
     def __init__(
         self,
         text: str,
@@ -297,8 +465,8 @@ class TextClip(Clip):
         self.text = text
         self.font_size = font_size
         self.font_family = font_family
-        self.color = color or Color(255, 255, 255)  # White by default
-        self.position = position or Position(0, 0)
+        self.color = color or _WHITE  # White by default
+        self.position = position or _ORIGIN
         self.size = size
         
         # Text-specific properties
@@ -309,6 +477,80 @@ class TextClip(Clip):
         self.background_color: Optional[Color] = None
         self.opacity = 1.0
     
+    @classmethod
+    def batch_create(
+        cls,
+        texts: Sequence[str],
+        start_times: Sequence[float],
+        durations: Sequence[float],
+        font_size: int = 24,
+        font_family: str = "Arial",
+        color: Optional[Color] = None,
+        position: Optional[Position] = None,
+        size: Optional[Size] = None,
+    ) -> List['TextClip']:
+        """
+        Create many text clips that share their formatting, e.g. subtitles.
+        
+        Args:
+            texts: Text content of each clip
+            start_times: When each clip starts on the timeline
+            durations: How long each clip lasts
+            font_size: Font size in points
+            font_family: Font family name
+            color: Text color
+            position: Position of the text on screen
+            size: Size of the text box
+            
+        Returns:
+            The clips, equivalent to constructing each one individually
+            
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        if not len(texts) == len(start_times) == len(durations):
+            raise ValueError("texts, start_times and durations must have the same length")
+        if cls is not TextClip:
+            # Subclasses may set up their own state in __init__
+            return [
+                cls(text, duration, start_time, font_size, font_family, color, position, size)
+                for text, start_time, duration in zip(texts, start_times, durations)
+            ]
+        
+        # Defaults come from a regular constructor call; each clip then only
+        # needs plain slot writes. Keep in step with Clip.__init__ and __init__.
+        proto = cls("", 0.0, 0.0, font_size, font_family, color, position, size)
+        font_size, font_family = proto.font_size, proto.font_family
+        color, position, size = proto.color, proto.position, proto.size
+        bold, italic, underline = proto.bold, proto.italic, proto.underline
+        alignment, background_color, opacity = proto.alignment, proto.background_color, proto.opacity
+        
+        new = cls.__new__
+        clips = []
+        for text, start_time, duration in zip(texts, start_times, durations):
+            clip = new(cls)
+            clip._track = None
+            clip._pos = -1
+            clip._start_time = start_time
+            clip._duration = duration
+            clip._end_time = None if duration is None else start_time + duration
+            clip.name = None
+            clip._properties = None
+            clip.text = text
+            clip.font_size = font_size
+            clip.font_family = font_family
+            clip.color = color
+            clip.position = position
+            clip.size = size
+            clip.bold = bold
+            clip.italic = italic
+            clip.underline = underline
+            clip.alignment = alignment
+            clip.background_color = background_color
+            clip.opacity = opacity
+            clips.append(clip)
+        return clips
+    
     def get_type(self) -> str:
         return "text"
     
@@ -324,11 +566,50 @@ class TextClip(Clip):
     
     def set_alignment(self, alignment: str) -> 'TextClip':
         """Set text alignment ('left', 'center', 'right')."""
-        if alignment not in ['left', 'center', 'right']:
+        if alignment not in {'left', 'center', 'right'}:
             raise ValueError("Alignment must be 'left', 'center', or 'right'")
         self.alignment = alignment
         return self
     
+    def configure(
+        self,
+        *,
+        bold: Optional[bool] = None,
+        italic: Optional[bool] = None,
+        underline: Optional[bool] = None,
+        alignment: Optional[str] = None,
+        background_color: Optional[Color] = None,
+    ) -> 'TextClip':
+        """
+        Set several text styles in one call instead of chaining setters.
+        
+        Args:
+            bold: Whether the text is bold
+            italic: Whether the text is italic
+            underline: Whether the text is underlined
+            alignment: Text alignment ('left', 'center', 'right')
+            background_color: Background color for the text
+            
+        Returns:
+            Self for method chaining; styles left as None are unchanged
+            
+        Raises:
+            ValueError: If alignment is not a valid value
+        """
+        if alignment is not None:
+            if alignment not in {'left', 'center', 'right'}:
+                raise ValueError("Alignment must be 'left', 'center', or 'right'")
+            self.alignment = alignment
+        if bold is not None:
+            self.bold = bold
+        if italic is not None:
+            self.italic = italic
+        if underline is not None:
+            self.underline = underline
+        if background_color is not None:
+            self.background_color = background_color
+        return self
+    
     def set_background(self, color: Color) -> 'TextClip':
         """Set background color for the text."""
         self.background_color = color
@@ -1,11 +1,21 @@
 """
 Timeline class - the main container for organizing video projects.
 """
-from typing import List, Optional, Dict, Any, Union
+import copy
+from array import array
+from contextlib import ExitStack, contextmanager
+from itertools import chain, repeat
+from typing import (
+    Collection, List, Mapping, Optional, Sequence, Dict, Any, Union, Iterator, TYPE_CHECKING
+)
 from pathlib import Path
 
 from .track import Track, TrackType
 from .clips import Clip, VideoClip, AudioClip, TextClip
+from ._kernels import active_mask
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Timeline:
@@ -17,6 +27,11 @@ class Timeline:
     interface for building video compositions.
     """
     
+    __slots__ = (
+        'width', 'height', 'framerate', 'name', '_tracks', '_properties',
+        'background_color', 'audio_sample_rate', 'audio_channels', '__weakref__',
+    )
+    
     def __init__(
         self,
         width: int = 1920,
@@ -38,7 +53,7 @@ class Timeline:
         self.framerate = framerate
         self.name = name
         self._tracks: List[Track] = []
-        self._properties: Dict[str, Any] = {}
+        self._properties: Optional[Dict[str, Any]] = None  # Allocated on first set_property
         
         # Timeline settings
         self.background_color = (0, 0, 0)  # RGB black
@@ -90,14 +105,21 @@ class Timeline:
             Self for method chaining
         """
         if isinstance(track, int):
-            if 0 <= track < len(self._tracks):
-                self._tracks.pop(track)
-        else:
-            try:
-                self._tracks.remove(track)
-            except ValueError:
-                pass
-        
+            return self.remove_track_at(track)
+        return self.remove_track_instance(track)
+    
+    def remove_track_at(self, index: int) -> 'Timeline':
+        """Remove the track at a specific index (ignored if out of range)."""
+        if 0 <= index < len(self._tracks):
+            self._tracks.pop(index)
+        return self
+    
+    def remove_track_instance(self, track: Track) -> 'Timeline':
+        """Remove a specific track (ignored if not on this timeline)."""
+        try:
+            self._tracks.remove(track)
+        except ValueError:
+            pass
         return self
     
     def get_track(self, index: int) -> Optional[Track]:
@@ -149,6 +171,22 @@ class Timeline:
         track.add_clip(clip)
         return self
     
+    @contextmanager
+    def bulk_edit(self) -> Iterator['Timeline']:
+        """
+        Context manager for making many clip edits across tracks at once.
+        
+        Enters Track.bulk_edit on every current track so per-operation
+        bookkeeping is done once when the block exits.
+        
+        Yields:
+            This timeline
+        """
+        with ExitStack() as stack:
+            for track in self._tracks:
+                stack.enter_context(track.bulk_edit())
+            yield self
+    
     def find_clips_at_time(self, time: float) -> Dict[int, List[Clip]]:
         """
         Find all clips active at a specific time across all tracks.
@@ -167,19 +205,38 @@ class Timeline:
                     result[i] = clips
         return result
     
+    def active_clip_mask(self, times: Sequence[float]) -> 'np.ndarray':
+        """
+        Evaluate which clips are active at each of many times across all tracks.
+        
+        Args:
+            times: Times in seconds to check, e.g. one per rendered frame
+            
+        Returns:
+            Boolean array of shape (len(times), number of clips) whose columns
+            follow get_all_clips(); clips on disabled tracks are never active
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        starts = array('d')
+        ends = array('d')
+        for track in self._tracks:
+            starts.extend(track._starts)
+            if track.enabled:
+                ends.extend(track._ends)
+            else:
+                ends.extend(repeat(float('-inf'), len(track._ends)))
+        return active_mask(starts, ends, times)
+    
     def get_all_clips(self) -> List[Clip]:
         """Get all clips from all tracks."""
-        all_clips = []
-        for track in self._tracks:
-            all_clips.extend(track.clips)
-        return all_clips
+        # Iterate tracks directly to avoid a defensive copy per track
+        return list(chain.from_iterable(self._tracks))
     
     def get_clips_by_type(self, clip_type: type) -> List[Clip]:
         """Get all clips of a specific type from all tracks."""
-        clips = []
-        for track in self._tracks:
-            clips.extend(track.get_clips_by_type(clip_type))
-        return clips
+        return [clip for clip in chain.from_iterable(self._tracks) if isinstance(clip, clip_type)]
     
     def clear_all_tracks(self) -> 'Timeline':
         """Remove all clips from all tracks."""
@@ -237,10 +294,14 @@ class Timeline:
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property on the timeline."""
+        if self._properties is None:
+            self._properties = {}
         self._properties[key] = value
     
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property from the timeline."""
+        if self._properties is None:
+            return default
         return self._properties.get(key, default)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -255,9 +316,32 @@ class Timeline:
             'audio_channels': self.audio_channels,
             'tracks': len(self._tracks),
             'duration': self.duration,
-            'properties': self._properties.copy()
+            'properties': self._properties.copy() if self._properties else {}
         }
     
+    def _clone_skeleton(self, skip: Mapping[int, Collection[int]]) -> 'Timeline':
+        """
+        Deep-copy the timeline except for the clips at the given positions.
+        
+        Used when filling templates, where the clips at placeholder positions
+        are replaced right away and copying them would be wasted work.
+        
+        Args:
+            skip: Clip indices not to copy, keyed by track index; the caller
+                must replace those clips in the copy
+            
+        Returns:
+            The copied timeline
+        """
+        memo: Dict[int, Any] = {}
+        clone = copy.copy(self)
+        clone._properties = copy.deepcopy(self._properties, memo)
+        clone._tracks = [
+            track._clone(skip.get(track_index, ()), memo)
+            for track_index, track in enumerate(self._tracks)
+        ]
+        return clone
+    
     @classmethod
     def create_standard_hd(cls, name: Optional[str] = None) -> 'Timeline':
         """Create a standard 1080p timeline."""
@@ -1,11 +1,20 @@
 """
 Track class for organizing clips in layers on a timeline.
 """
-from typing import List, Optional, Union, Iterator, Dict, Any
+import copy
+import weakref
+from array import array
+from contextlib import contextmanager
+from typing import Collection, List, Optional, Sequence, Union, Iterator, Dict, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 
 from .clips import Clip, VideoClip, AudioClip, ImageClip, TextClip
 from .transitions import Transition
+from ._kernels import INDEX_THRESHOLD, SortedStabIndex, StabIndex, active_mask, latest_end, stab
+from ._slots import get_slot_state, set_slot_state
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class TrackType(Enum):
@@ -16,6 +25,14 @@ class TrackType(Enum):
     COMPOSITE = "composite"  # Can hold multiple clip types
 
 
+# Clip classes each track type accepts; composite tracks accept all clip types
+_TRACK_CLIP_TYPES: Dict[TrackType, Tuple[type, ...]] = {
+    TrackType.VIDEO: (VideoClip, ImageClip),
+    TrackType.AUDIO: (AudioClip,),
+    TrackType.TEXT: (TextClip,),
+}
+
+
 class Track:
     """
     Represents a track on a timeline that contains clips and transitions.
@@ -24,6 +41,12 @@ class Track:
     Different track types can hold different kinds of clips.
     """
     
+    __slots__ = (
+        'track_type', 'name', 'enabled', '_clips', '_starts', '_ends', '_stab_index',
+        '_duration', '_bulk_depth', '_positions_stale', '_transitions', '_properties',
+        'opacity', 'muted', 'locked', '__weakref__',
+    )
+    
     def __init__(
         self,
         track_type: TrackType = TrackType.COMPOSITE,
@@ -42,8 +65,18 @@ class Track:
         self.name = name
         self.enabled = enabled
         self._clips: List[Clip] = []
+        # Clip start/end times as parallel C-double arrays, in the same order as _clips
+        self._starts = array('d')
+        self._ends = array('d')
+        # Point-query index: None until queried, False after one query since
+        # the last edit, then the built index (True when scanning is best)
+        self._stab_index: Union[SortedStabIndex, StabIndex, bool, None] = None
+        self._duration: Optional[float] = None  # Cached duration, reset on time edits
+        # While bulk editing, stored clip positions may be stale until the edit ends
+        self._bulk_depth = 0
+        self._positions_stale = False
         self._transitions: Dict[int, Transition] = {}  # clip_index -> transition
-        self._properties: Dict[str, Any] = {}
+        self._properties: Optional[Dict[str, Any]] = None  # Allocated on first set_property
         
         # Track-level properties
         self.opacity = 1.0
@@ -58,9 +91,10 @@ class Track:
     @property
     def duration(self) -> float:
         """Calculate the total duration of the track."""
-        if not self._clips:
-            return 0.0
-        return max(clip.end_time for clip in self._clips if clip.duration is not None)
+        if self._duration is None:
+            end = latest_end(self._ends)
+            self._duration = end if end != float('-inf') else 0.0
+        return self._duration
     
     def add_clip(self, clip: Clip, index: Optional[int] = None) -> 'Track':
         """
@@ -74,17 +108,49 @@ class Track:
             Self for method chaining
             
         Raises:
-            ValueError: If clip type doesn't match track type restrictions
+            ValueError: If clip type doesn't match track type restrictions,
+                or the clip is already on a track
         """
         self._validate_clip_type(clip)
+        self._validate_unowned(clip)
         
+        start, end = self._clip_bounds(clip)
         if index is None:
             self._clips.append(clip)
+            self._starts.append(start)
+            self._ends.append(end)
+            self._bind(clip, len(self._clips) - 1)
         else:
             self._clips.insert(index, clip)
+            self._starts.insert(index, start)
+            self._ends.insert(index, end)
+            self._bind(clip, -1)
+            self._reindex()  # Clips after the insertion point shifted
         
+        self._times_changed()
         return self
     
+    def try_add_clip(self, clip: Clip, index: Optional[int] = None) -> bool:
+        """
+        Add a clip if the track type accepts it, without raising.
+        
+        Args:
+            clip: The clip to add
+            index: Optional index to insert at (default: append)
+            
+        Returns:
+            True if the clip was added, False if its type is not accepted
+        """
+        if not self.accepts_clip(clip):
+            return False
+        self.add_clip(clip, index)
+        return True
+    
+    def accepts_clip(self, clip: Clip) -> bool:
+        """Check whether the clip type is compatible with the track type."""
+        allowed_types = _TRACK_CLIP_TYPES.get(self.track_type)
+        return allowed_types is None or isinstance(clip, allowed_types)
+    
     def remove_clip(self, clip: Union[Clip, int]) -> 'Track':
         """
         Remove a clip from the track.
@@ -96,26 +162,78 @@ class Track:
             Self for method chaining
         """
         if isinstance(clip, int):
-            if 0 <= clip < len(self._clips):
-                # Remove any transition associated with this clip
-                if clip in self._transitions:
-                    del self._transitions[clip]
-                self._clips.pop(clip)
-        else:
-            try:
-                index = self._clips.index(clip)
-                if index in self._transitions:
-                    del self._transitions[index]
-                self._clips.remove(clip)
-            except ValueError:
-                pass  # Clip not found, ignore
+            return self.remove_clip_at(clip)
+        return self.remove_clip_instance(clip)
+    
+    def remove_clip_at(self, index: int) -> 'Track':
+        """
+        Remove the clip at a specific index.
         
+        Args:
+            index: Index of the clip to remove (ignored if out of range)
+            
+        Returns:
+            Self for method chaining
+        """
+        if 0 <= index < len(self._clips):
+            # Remove any transition associated with this clip
+            if index in self._transitions:
+                del self._transitions[index]
+            self._pop_clip(index)
         return self
     
+    def remove_clip_instance(self, clip: Clip) -> 'Track':
+        """
+        Remove a specific clip from the track.
+        
+        Args:
+            clip: Clip instance to remove (ignored if not on this track)
+            
+        Returns:
+            Self for method chaining
+        """
+        try:
+            index = self._index_of(clip)
+        except ValueError:
+            return self  # Clip not found, ignore
+        return self.remove_clip_at(index)
+    
     def insert_clip(self, clip: Clip, index: int) -> 'Track':
         """Insert a clip at a specific index."""
         return self.add_clip(clip, index)
     
+    def replace_clip(self, index: int, clip: Clip) -> 'Track':
+        """
+        Replace the clip at a specific index, keeping any transition after it.
+        
+        Args:
+            index: Index of the clip to replace
+            clip: The new clip
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            ValueError: If clip type doesn't match track type restrictions,
+                or the clip is already on a track
+            IndexError: If index is out of range
+        """
+        self._validate_clip_type(clip)
+        
+        old_clip = self._clips[index]
+        if old_clip is not clip:
+            self._validate_unowned(clip)
+        if old_clip is not clip and self._owns(old_clip):
+            self._unbind(old_clip)
+        
+        start, end = self._clip_bounds(clip)
+        self._clips[index] = clip
+        self._starts[index] = start
+        self._ends[index] = end
+        self._bind(clip, index % len(self._clips))
+        self._times_changed()
+        return self
+    
     def get_clip(self, index: int) -> Optional[Clip]:
         """Get a clip by index."""
         if 0 <= index < len(self._clips):
@@ -124,12 +242,34 @@ class Track:
     
     def find_clips_at_time(self, time: float) -> List[Clip]:
         """Find all clips that are active at a specific time."""
-        active_clips = []
-        for clip in self._clips:
-            if clip.duration is not None:
-                if clip.start_time <= time < clip.end_time:
-                    active_clips.append(clip)
-        return active_clips
+        clips = self._clips
+        index = self._stab_index
+        if index is None:
+            # Defer building until a second query shows the track is being read
+            self._stab_index = False
+        else:
+            if index is False:
+                index = self._stab_index = self._build_stab_index()
+            if index is not True:
+                return [clips[i] for i in index.query(time)]
+        
+        return [clips[i] for i in stab(self._starts, self._ends, time)]
+    
+    def active_clip_mask(self, times: Sequence[float]) -> 'np.ndarray':
+        """
+        Evaluate which clips are active at each of many times, e.g. every frame.
+        
+        Args:
+            times: Times in seconds to check
+            
+        Returns:
+            Boolean array of shape (len(times), len(track)) whose entry [f, i]
+            tells whether clip i is active at times[f]
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        return active_mask(self._starts, self._ends, times)
     
     def add_transition(self, clip_index: int, transition: Transition) -> 'Track':
         """
@@ -158,8 +298,14 @@ class Track:
     
     def clear(self) -> 'Track':
         """Remove all clips and transitions from the track."""
+        for clip in self._clips:
+            if self._owns(clip):
+                self._unbind(clip)
         self._clips.clear()
+        del self._starts[:]
+        del self._ends[:]
         self._transitions.clear()
+        self._times_changed()
         return self
     
     def set_opacity(self, opacity: float) -> 'Track':
@@ -184,38 +330,185 @@ class Track:
     
     def sort_clips_by_time(self) -> 'Track':
         """Sort clips by their start time."""
-        self._clips.sort(key=lambda clip: clip.start_time)
+        order = sorted(range(len(self._clips)), key=self._starts.__getitem__)
+        self._clips = [self._clips[i] for i in order]
+        self._starts = array('d', (self._starts[i] for i in order))
+        self._ends = array('d', (self._ends[i] for i in order))
+        self._reindex()
+        self._times_changed()
         return self
     
+    @contextmanager
+    def bulk_edit(self) -> Iterator['Track']:
+        """
+        Context manager for making many clip edits at once.
+        
+        Position bookkeeping for inserted and removed clips is deferred
+        until the outermost bulk edit ends, so loading or rearranging many
+        clips pays for it once instead of per operation.
+        
+        Yields:
+            This track
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._positions_stale:
+                self._reindex()
+    
     def get_clips_by_type(self, clip_type: type) -> List[Clip]:
         """Get all clips of a specific type."""
         return [clip for clip in self._clips if isinstance(clip, clip_type)]
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property on the track."""
+        if self._properties is None:
+            self._properties = {}
         self._properties[key] = value
     
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property from the track."""
+        if self._properties is None:
+            return default
         return self._properties.get(key, default)
     
+    def _clone(self, skip: Collection[int], memo: Dict[int, Any]) -> 'Track':
+        """
+        Deep-copy the track except for the clips at the given indices.
+        
+        Skipped slots keep referring to the original clips without binding
+        them to the copy, so the caller must replace them.
+        
+        Args:
+            skip: Indices of clips not to copy
+            memo: copy.deepcopy memo shared across the whole copy
+            
+        Returns:
+            The copied track
+        """
+        clone = copy.copy(self)
+        clone._clips = [
+            clip if i in skip else copy.deepcopy(clip, memo)
+            for i, clip in enumerate(self._clips)
+        ]
+        clone._starts = array('d', self._starts)
+        clone._ends = array('d', self._ends)
+        clone._bulk_depth = 0
+        clone._positions_stale = False
+        clone._transitions = copy.deepcopy(self._transitions, memo)
+        clone._properties = copy.deepcopy(self._properties, memo)
+        for i, clip in enumerate(clone._clips):
+            if i not in skip:
+                clone._bind(clip, i)
+        return clone
+    
+    @staticmethod
+    def _clip_bounds(clip: Clip) -> Tuple[float, float]:
+        """Get the (start, end) interval of a clip; clips without duration are never active."""
+        end_time = clip._end_time
+        if end_time is None:
+            return clip._start_time, float('-inf')  # Also keeps it out of the track duration
+        return clip._start_time, end_time
+    
+    def _pop_clip(self, index: int) -> Clip:
+        """Remove the clip at index together with its time entries."""
+        clip = self._clips.pop(index)
+        del self._starts[index]
+        del self._ends[index]
+        if self._owns(clip):
+            self._unbind(clip)
+        if index < len(self._clips):
+            self._reindex(index)
+        self._times_changed()
+        return clip
+    
+    def _owns(self, clip: Clip) -> bool:
+        """Check whether this track is the clip's owning track."""
+        return clip._track is not None and clip._track() is self
+    
+    def _bind(self, clip: Clip, index: int) -> None:
+        """Record this track as the clip's owner."""
+        clip._track = weakref.ref(self)
+        clip._pos = index
+    
+    @staticmethod
+    def _unbind(clip: Clip) -> None:
+        """Detach a clip from its owning track."""
+        clip._track = None
+        clip._pos = -1
+    
+    def _index_of(self, clip: Clip) -> int:
+        """Get the index of a clip on this track, raising ValueError if absent."""
+        if not self._positions_stale and self._owns(clip):
+            return clip._pos  # Owned clips know their position
+        for i, existing in enumerate(self._clips):
+            if existing is clip:
+                return i
+        raise ValueError("Clip is not on this track")
+    
+    def _reindex(self, start: int = 0) -> None:
+        """Refresh stored positions of owned clips from index start onward."""
+        if self._bulk_depth:
+            self._positions_stale = True
+            return
+        
+        self._positions_stale = False
+        clips = self._clips
+        for i in range(start, len(clips)):
+            clip = clips[i]
+            if self._owns(clip):
+                clip._pos = i
+    
+    def _update_clip_times(self, clip: Clip) -> None:
+        """Refresh the cached time entries after a clip's timing changed."""
+        index = self._index_of(clip)
+        start, end = self._clip_bounds(clip)
+        self._starts[index] = start
+        self._ends[index] = end
+        self._times_changed()
+    
+    def _build_stab_index(self) -> Union[SortedStabIndex, StabIndex, bool]:
+        """Build the best point-query index for the current clip times."""
+        index = SortedStabIndex.from_sorted(self._starts, self._ends)
+        if index is not None:
+            return index  # Clips in time order, the usual layout
+        if len(self._clips) >= INDEX_THRESHOLD:
+            return StabIndex(self._starts, self._ends)
+        return True  # Small unsorted track: a scan is cheapest
+    
+    def _times_changed(self) -> None:
+        """Drop data derived from the clip time arrays after they changed."""
+        self._stab_index = None
+        self._duration = None
+    
     def _validate_clip_type(self, clip: Clip) -> None:
         """Validate that the clip type is compatible with the track type."""
-        if self.track_type == TrackType.COMPOSITE:
-            return  # Composite tracks accept all clip types
-        
-        valid_types = {
-            TrackType.VIDEO: (VideoClip, ImageClip),
-            TrackType.AUDIO: (AudioClip,),
-            TrackType.TEXT: (TextClip,),
-        }
-        
-        if self.track_type in valid_types:
-            allowed_types = valid_types[self.track_type]
-            if not isinstance(clip, allowed_types):
-                raise ValueError(
-                    f"Track type {self.track_type.value} cannot contain {type(clip).__name__}"
-                )
+        if not self.accepts_clip(clip):
+            raise ValueError(
+                f"Track type {self.track_type.value} cannot contain {type(clip).__name__}"
+            )
+    
+    @staticmethod
+    def _validate_unowned(clip: Clip) -> None:
+        """Reject a clip that is already bound to a track."""
+        # A clip reports timing changes to a single owning track, so sharing
+        # one between tracks would leave the other track's times stale
+        if clip._track is not None and clip._track() is not None:
+            raise ValueError("Clip is already on a track; remove it first")
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Collect the track's attributes for copying and pickling."""
+        return get_slot_state(self)
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a copied or unpickled track and re-attach its clips."""
+        set_slot_state(self, state)
+        self._times_changed()
+        for i, clip in enumerate(self._clips):
+            if clip._track is None:
+                self._bind(clip, i)
     
     def __len__(self) -> int:
         """Return the number of clips on the track."""
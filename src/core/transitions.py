@@ -2,7 +2,8 @@
 Transition classes for creating smooth transitions between clips.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import ClassVar, Optional, Dict, Any, Mapping, Tuple
 from enum import Enum
 
 
@@ -13,6 +14,11 @@ class TransitionType(Enum):
     SLIDE = "slide"
     FADE = "fade"
     DISSOLVE = "dissolve"
+    
+    @property
+    def code(self) -> int:
+        """Stable integer code for fast dispatch in renderers."""
+        return _TRANSITION_TYPE_CODES[self]
 
 
 class WipeDirection(Enum):
@@ -21,6 +27,29 @@ class WipeDirection(Enum):
     RIGHT_TO_LEFT = "right_to_left"
     TOP_TO_BOTTOM = "top_to_bottom"
     BOTTOM_TO_TOP = "bottom_to_top"
+    
+    @property
+    def code(self) -> int:
+        """Stable integer code for fast dispatch in renderers."""
+        return _WIPE_DIRECTION_CODES[self]
+
+
+# Integer codes follow declaration order; append new members at the end
+_TRANSITION_TYPE_CODES: Dict[TransitionType, int] = {
+    member: code for code, member in enumerate(TransitionType)
+}
+_WIPE_DIRECTION_CODES: Dict[WipeDirection, int] = {
+    member: code for code, member in enumerate(WipeDirection)
+}
+
+# Crossfade curve names mapped to their canonical (interned literal) strings,
+# so validation is one hash lookup and stored curves compare by identity
+_CROSSFADE_CURVES: Dict[str, str] = {
+    curve: curve for curve in ("linear", "ease_in", "ease_out", "ease_in_out")
+}
+_CROSSFADE_CURVE_CODES: Dict[str, int] = {
+    curve: code for code, curve in enumerate(_CROSSFADE_CURVES)
+}
 
 
 class Transition(ABC):
@@ -31,6 +60,9 @@ class Transition(ABC):
     to create smooth visual or audio transitions.
     """
     
+    # Names of the get_parameters_tuple() positions
+    parameter_fields: ClassVar[Tuple[str, ...]] = ()
+    
     def __init__(
         self,
         duration: float,
@@ -43,16 +75,49 @@ class Transition(ABC):
             duration: Duration of the transition in seconds
             name: Optional name for the transition
         """
+        self._parameters: Optional[Mapping[str, Any]] = None  # Built on first get_parameters
         self.duration = duration
         self.name = name
-        self._properties: Dict[str, Any] = {}
+        self._properties: Optional[Dict[str, Any]] = None  # Allocated on first set_property
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Check that a subclass provides its parameters.
+        
+        Raises:
+            TypeError: If neither get_parameters nor _build_parameters is overridden
+        """
+        super().__init_subclass__(**kwargs)
+        if (
+            cls.get_parameters is Transition.get_parameters
+            and cls._build_parameters is Transition._build_parameters
+        ):
+            raise TypeError(
+                f"{cls.__name__} must override get_parameters or _build_parameters"
+            )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any public attribute may feed the parameters, so drop the cached view
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_parameters', None)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the cached parameters view, which cannot be copied or pickled."""
+        state = self.__dict__.copy()
+        state['_parameters'] = None
+        return state
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property on the transition."""
+        if self._properties is None:
+            self._properties = {}
         self._properties[key] = value
     
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property from the transition."""
+        if self._properties is None:
+            return default
         return self._properties.get(key, default)
     
     @abstractmethod
@@ -60,10 +125,35 @@ class Transition(ABC):
         """Return the type of transition."""
         pass
     
-    @abstractmethod
-    def get_parameters(self) -> Dict[str, Any]:
-        """Return parameters specific to this transition type."""
-        pass
+    def get_parameters(self) -> Mapping[str, Any]:
+        """
+        Return parameters specific to this transition type.
+        
+        The result is a read-only view, cached until an attribute changes.
+        """
+        parameters = self._parameters
+        if parameters is None:
+            parameters = self._parameters = MappingProxyType(self._build_parameters())
+        return parameters
+    
+    def _build_parameters(self) -> Dict[str, Any]:
+        """
+        Build the parameters returned by get_parameters.
+        
+        Subclasses either implement this hook, gaining the cached view, or
+        override get_parameters itself; __init_subclass__ enforces one or the other.
+        """
+    
+    def get_parameters_tuple(self) -> Tuple[Any, ...]:
+        """
+        Return the parameters positionally, as named by parameter_fields.
+        
+        Built-in transitions give enumerated values as integer codes, so
+        renderers that know the transition type can index and dispatch without
+        hashing. The default reads the parameter_fields from get_parameters.
+        """
+        parameters = self.get_parameters()
+        return tuple(parameters[field] for field in self.parameter_fields)
 
 
 class CrossfadeTransition(Transition):
@@ -74,6 +164,8 @@ class CrossfadeTransition(Transition):
     fades out while the incoming clip fades in simultaneously.
     """
     
+    parameter_fields = ('duration', 'curve_code')
+    
     def __init__(
         self,
         duration: float,
@@ -89,29 +181,42 @@ class CrossfadeTransition(Transition):
             name: Optional name for the transition
         """
         super().__init__(duration, name)
-        self.curve = curve
-        
-        # Validate curve type
-        valid_curves = ["linear", "ease_in", "ease_out", "ease_in_out"]
-        if curve not in valid_curves:
-            raise ValueError(f"Curve must be one of: {valid_curves}")
+        self.curve = self._canonical_curve(curve)
     
     def get_type(self) -> TransitionType:
         return TransitionType.CROSSFADE
     
-    def get_parameters(self) -> Dict[str, Any]:
+    def _build_parameters(self) -> Dict[str, Any]:
         return {
             "curve": self.curve,
             "duration": self.duration,
         }
     
+    def get_parameters_tuple(self) -> Tuple[float, int]:
+        return (self.duration, _CROSSFADE_CURVE_CODES[self.curve])
+    
+    @property
+    def curve_code(self) -> int:
+        """Stable integer code of the curve for fast dispatch in renderers."""
+        return _CROSSFADE_CURVE_CODES[self.curve]
+    
     def set_curve(self, curve: str) -> 'CrossfadeTransition':
         """Set the fade curve type."""
-        valid_curves = ["linear", "ease_in", "ease_out", "ease_in_out"]
-        if curve not in valid_curves:
-            raise ValueError(f"Curve must be one of: {valid_curves}")
-        self.curve = curve
+        self.curve = self._canonical_curve(curve)
         return self
+    
+    @staticmethod
+    def validate_curve(curve: str) -> bool:
+        """Check whether a curve name is valid, without raising."""
+        return curve in _CROSSFADE_CURVES
+    
+    @staticmethod
+    def _canonical_curve(curve: str) -> str:
+        """Validate a curve name and return its canonical string."""
+        canonical = _CROSSFADE_CURVES.get(curve)
+        if canonical is None:
+            raise ValueError(f"Curve must be one of: {list(_CROSSFADE_CURVES)}")
+        return canonical
 
 
 class WipeTransition(Transition):
@@ -122,6 +227,8 @@ class WipeTransition(Transition):
     clip is hidden.
     """
     
+    parameter_fields = ('duration', 'direction_code', 'feather')
+    
     def __init__(
         self,
         duration: float,
@@ -140,18 +247,21 @@ class WipeTransition(Transition):
         """
         super().__init__(duration, name)
         self.direction = direction
-        self.feather = max(0.0, min(1.0, feather))
+        self.feather = 0.0 if feather < 0.0 else feather if feather <= 1.0 else 1.0
     
     def get_type(self) -> TransitionType:
         return TransitionType.WIPE
     
-    def get_parameters(self) -> Dict[str, Any]:
+    def _build_parameters(self) -> Dict[str, Any]:
         return {
             "direction": self.direction.value,
             "feather": self.feather,
             "duration": self.duration,
         }
     
+    def get_parameters_tuple(self) -> Tuple[float, int, float]:
+        return (self.duration, self.direction.code, self.feather)
+    
     def set_direction(self, direction: WipeDirection) -> 'WipeTransition':
         """Set the wipe direction."""
         self.direction = direction
@@ -159,7 +269,7 @@ class WipeTransition(Transition):
     
     def set_feather(self, feather: float) -> 'WipeTransition':
         """Set the feather amount (softness of the edge)."""
-        self.feather = max(0.0, min(1.0, feather))
+        self.feather = 0.0 if feather < 0.0 else feather if feather <= 1.0 else 1.0
         return self
 
 
@@ -170,6 +280,8 @@ class FadeTransition(Transition):
     Unlike crossfade, this creates a gap where both clips are partially transparent.
     """
     
+    parameter_fields = ('duration', 'fade_r', 'fade_g', 'fade_b')
+    
     def __init__(
         self,
         duration: float,
@@ -190,12 +302,16 @@ class FadeTransition(Transition):
     def get_type(self) -> TransitionType:
         return TransitionType.FADE
     
-    def get_parameters(self) -> Dict[str, Any]:
+    def _build_parameters(self) -> Dict[str, Any]:
         return {
             "fade_color": self.fade_color,
             "duration": self.duration,
         }
     
+    def get_parameters_tuple(self) -> Tuple[float, int, int, int]:
+        r, g, b = self.fade_color
+        return (self.duration, r, g, b)
+    
     def set_fade_color(self, r: int, g: int, b: int) -> 'FadeTransition':
         """Set the color to fade to/from."""
         self.fade_color = (r, g, b)
@@ -207,6 +323,8 @@ class SlideTransition(Transition):
     A slide transition that slides the incoming clip over the outgoing clip.
     """
     
+    parameter_fields = ('duration', 'direction_code')
+    
     def __init__(
         self,
         duration: float,
@@ -227,12 +345,15 @@ class SlideTransition(Transition):
     def get_type(self) -> TransitionType:
         return TransitionType.SLIDE
     
-    def get_parameters(self) -> Dict[str, Any]:
+    def _build_parameters(self) -> Dict[str, Any]:
         return {
             "direction": self.direction.value,
             "duration": self.duration,
         }
     
+    def get_parameters_tuple(self) -> Tuple[float, int]:
+        return (self.duration, self.direction.code)
+    
     def set_direction(self, direction: WipeDirection) -> 'SlideTransition':
         """Set the slide direction."""
         self.direction = direction
@@ -1,17 +1,33 @@
 """
 RenderQueue class with sequential and parallel processing capabilities.
 """
+import base64
+import hashlib
 import multiprocessing as mp
+import os
+import pickle
+import queue
 import threading
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Deque, Dict, List, Optional, Any, Callable, Tuple, Union
 from datetime import datetime
+from importlib.util import find_spec
 
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    SHARED_MEMORY_AVAILABLE = False
+
+from .._compat import DATACLASS_SLOTS
 from ..core.timeline import Timeline
 from ..ports.renderer import Renderer, RenderOptions, RenderError
 from ..templates.placeholder import VideoTemplate
@@ -26,6 +42,10 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+_FINISHED_STATES = frozenset((JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED))
+_ACTIVE_STATES = frozenset((JobStatus.PENDING, JobStatus.RUNNING))
+
+
 class QueueMode(Enum):
     """Processing mode for the render queue."""
     SEQUENTIAL = "sequential"
@@ -33,7 +53,14 @@ class QueueMode(Enum):
     PARALLEL_THREAD = "parallel_thread"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class RenderJobExtras:
+    """Rarely set render job fields, allocated on first write."""
+    template_data: Optional[Dict[str, Any]] = None  # For template-based jobs
+    error_message: Optional[str] = None
+
+
+@dataclass(init=False, **DATACLASS_SLOTS)
 class RenderJob:
     """Represents a single render job in the queue."""
     id: str
@@ -41,26 +68,112 @@ class RenderJob:
     output_path: Path
     renderer: Renderer
     options: Optional[RenderOptions] = None
-    template_data: Optional[Dict[str, Any]] = None  # For template-based jobs
     status: JobStatus = JobStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
     progress: float = 0.0  # 0.0 to 100.0
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Backing store for template_data and error_message
+    extras: Optional[RenderJobExtras] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Monotonic clock readings backing duration, immune to wall clock changes
+    _started_mono: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _completed_mono: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # When and at what progress the progress callback last fired
+    _last_callback_time: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+    _last_callback_progress: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        timeline: Timeline,
+        output_path: Path,
+        renderer: Renderer,
+        options: Optional[RenderOptions] = None,
+        template_data: Optional[Dict[str, Any]] = None,
+        status: JobStatus = JobStatus.PENDING,
+        created_at: Optional[datetime] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        error_message: Optional[str] = None,
+        progress: float = 0.0,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize a render job.
+        
+        template_data and error_message are stored in the lazily allocated
+        extras record; the parameter order is that of the original fields.
+        """
+        self.id = id
+        self.timeline = timeline
+        self.output_path = output_path
+        self.renderer = renderer
+        self.options = options
+        self.status = status
+        self.created_at = datetime.now() if created_at is None else created_at
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.progress = progress
+        self.metadata = {} if metadata is None else metadata
+        self.extras = None
+        if template_data is not None or error_message is not None:
+            self.extras = RenderJobExtras(template_data, error_message)
+        self._started_mono = None
+        self._completed_mono = None
+        self._last_callback_time = 0.0
+        self._last_callback_progress = 0.0
+    
+    @property
+    def template_data(self) -> Optional[Dict[str, Any]]:
+        """Get the data used to fill the job's template, if any."""
+        return self.extras.template_data if self.extras else None
+    
+    @template_data.setter
+    def template_data(self, value: Optional[Dict[str, Any]]) -> None:
+        """Set the template data."""
+        self._get_extras().template_data = value
+    
+    @property
+    def error_message(self) -> Optional[str]:
+        """Get the error message of a failed job."""
+        return self.extras.error_message if self.extras else None
+    
+    @error_message.setter
+    def error_message(self, value: Optional[str]) -> None:
+        """Set the error message."""
+        self._get_extras().error_message = value
+    
+    def _get_extras(self) -> RenderJobExtras:
+        """Get the extras record, allocating it on first use."""
+        if self.extras is None:
+            self.extras = RenderJobExtras()
+        return self.extras
+    
     @property
     def duration(self) -> Optional[float]:
         """Get the job duration in seconds."""
-        if self.started_at and self.completed_at:
-            return (self.completed_at - self.started_at).total_seconds()
+        if self._started_mono is not None and self._completed_mono is not None:
+            return self._completed_mono - self._started_mono
         return None
     
     @property
     def is_finished(self) -> bool:
         """Check if the job is finished (completed, failed, or cancelled)."""
-        return self.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
+        return self.status in _FINISHED_STATES
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary representation."""
@@ -79,10 +192,32 @@ class RenderJob:
 
 
 class JobProgressCallback:
-    """Callback interface for job progress updates."""
+    """
+    Callback interface for job progress updates.
+    
+    Progress updates are coalesced: the callback fires for a progress update
+    only if min_interval seconds have passed since it last fired for that
+    job, progress advanced by at least min_delta percent, or the job reached
+    100%. Start, completion and failure events always fire.
+    """
     
-    def __init__(self, callback: Optional[Callable[[RenderJob], None]] = None):
+    def __init__(
+        self,
+        callback: Optional[Callable[[RenderJob], None]] = None,
+        min_interval: float = 0.05,
+        min_delta: float = 1.0,
+    ):
+        """
+        Initialize the callback.
+        
+        Args:
+            callback: Function called with the job on each reported event
+            min_interval: Minimum seconds between progress callbacks per job
+            min_delta: Progress change in percent that fires a callback early
+        """
         self.callback = callback
+        self.min_interval = min_interval
+        self.min_delta = min_delta
     
     def on_job_started(self, job: RenderJob) -> None:
         """Called when a job starts."""
@@ -92,7 +227,17 @@ class JobProgressCallback:
     def on_job_progress(self, job: RenderJob, progress: float) -> None:
         """Called when job progress updates."""
         job.progress = progress
-        if self.callback:
+        if not self.callback:
+            return
+        
+        now = time.monotonic()
+        if (
+            now - job._last_callback_time >= self.min_interval
+            or progress - job._last_callback_progress >= self.min_delta
+            or progress >= 100.0
+        ):
+            job._last_callback_time = now
+            job._last_callback_progress = progress
             self.callback(job)
     
     def on_job_completed(self, job: RenderJob) -> None:
@@ -107,38 +252,181 @@ class JobProgressCallback:
             self.callback(job)
 
 
-def _render_job_worker(job_data: Dict[str, Any]) -> Dict[str, Any]:
+# Modules the forkserver can import once so workers start with them loaded;
+# top-level packages only, as MoviePy 1.x and 2.x lay out submodules differently
+_FORKSERVER_PRELOAD = ("aive.pipeline.render_queue", "numpy", "moviepy")
+
+# Out-of-band pickle buffers at least this large are passed to worker
+# processes through shared memory instead of the pickle stream
+SHARED_BUFFER_THRESHOLD = 1 << 20
+
+
+def _pack_payload(obj: Any) -> Tuple[bytes, List[Tuple[str, int]], List[Any]]:
     """
-    Worker function for multiprocessing render jobs.
+    Pickle a job payload, moving large buffers into shared memory.
     
-    This function is defined at module level to be picklable.
+    Objects that support pickle protocol 5 out-of-band buffers, such as NumPy
+    arrays stored on clips, have their data copied once into a shared memory
+    block that the worker maps directly, rather than being copied into the
+    pickle stream and again through the queue pipe.
+    
+    Args:
+        obj: Object to pickle
+        
+    Returns:
+        Tuple of (pickle data, (block name, size) per out-of-band buffer,
+        shared memory blocks to release with _release_blocks once the job
+        is finished)
     """
+    blocks = []
+    spec = []
+    
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            view = buffer.raw()
+        except BufferError:
+            return True  # Non-contiguous, leave it to pickle
+        
+        if not SHARED_MEMORY_AVAILABLE or view.nbytes < SHARED_BUFFER_THRESHOLD:
+            return True  # Serialize in-band
+        
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        blocks.append(block)
+        block.buf[:view.nbytes] = view
+        spec.append((block.name, view.nbytes))
+        return False
+    
     try:
-        # Reconstruct job from serialized data
-        # Note: In a real implementation, this would need proper serialization
-        # of Timeline and Renderer objects, which is complex
-        
-        result = {
-            'job_id': job_data['job_id'],
-            'status': 'completed',
-            'error': None,
-            'started_at': datetime.now().isoformat(),
-            'completed_at': datetime.now().isoformat(),
-        }
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+    except Exception:
+        _release_blocks(blocks)
+        raise
+    
+    return data, spec, blocks
+
+
+def _release_blocks(blocks: List[Any]) -> None:
+    """Close and unlink shared memory blocks created by _pack_payload."""
+    for block in blocks:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _close_blocks(blocks: List[Any]) -> None:
+    """Detach from shared memory blocks, leaving any still in use to the GC."""
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass
+
+
+def _render_payload(payload: bytes, buffers: List[memoryview], renderers: Dict[int, Renderer]) -> None:
+    """Unpickle a job message and render it."""
+    renderer_key, renderer, timeline, output_path, options = pickle.loads(payload, buffers=buffers)
+    if renderer is None:
+        renderer = renderers[renderer_key]
+    
+    renderer.render(timeline, output_path, options)
+
+
+def _new_job_id() -> str:
+    """Generate a random job ID: a UUID4 as 22 URL-safe base64 characters."""
+    return base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b'=').decode('ascii')
+
+
+def _digest(data: Any) -> str:
+    """Compute a short hex digest identifying a payload."""
+    try:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        payload = repr(data).encode("utf-8")  # Unpicklable, fall back to its repr
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _get_process_context(preload: bool = False) -> Any:
+    """
+    Get the multiprocessing context used for render workers.
+    
+    Prefers forkserver, which forks workers from a single server process,
+    and falls back to spawn where forkserver isn't available (Windows).
+    
+    Args:
+        preload: Have the forkserver import the render stack before forking.
+            The preload list is process-wide multiprocessing state, so it is
+            only changed on request.
+    """
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        if preload:
+            ctx.set_forkserver_preload(
+                [name for name in _FORKSERVER_PRELOAD if find_spec(name) is not None]
+            )
+        return ctx
+    return mp.get_context("spawn")
+
+
+def _pin_to_cpu(worker_index: int) -> None:
+    """Pin the calling process to one of its allowed CPUs, where supported."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpus[worker_index % len(cpus)]})
+
+
+def _process_worker_loop(
+    in_queue: 'mp.Queue',
+    out_queue: 'mp.Queue',
+    renderers: Dict[int, Renderer],
+    worker_index: int = 0,
+    pin_cpu: bool = False,
+) -> None:
+    """
+    Main loop of a long-lived render worker process.
+    
+    The renderers shared by the queued jobs are shipped once when the worker
+    starts, so job messages only carry the timeline and output settings.
+    This function is defined at module level to be picklable.
+    
+    Args:
+        in_queue: Queue of (job_id, pickled job, shared buffer spec) messages,
+            None to shut down
+        out_queue: Queue receiving one status/error result dict per job
+        renderers: Renderers keyed by the IDs used in job messages
+        worker_index: Index of this worker in the pool
+        pin_cpu: Pin this worker to a single CPU chosen by its index
+    """
+    if pin_cpu:
+        _pin_to_cpu(worker_index)
+    
+    while True:
+        message = in_queue.get()
+        if message is None:
+            break
         
-        # Simulate rendering work
-        time.sleep(1)  # Placeholder for actual rendering
+        job_id, payload, buffer_spec = message
+        blocks = []
+        try:
+            blocks = [shared_memory.SharedMemory(name=name) for name, _ in buffer_spec]
+            buffers = [block.buf[:size] for block, (_, size) in zip(blocks, buffer_spec)]
+            _render_payload(payload, buffers, renderers)
+            status, error = JobStatus.COMPLETED.value, None
+        except Exception as e:
+            status, error = JobStatus.FAILED.value, str(e)
         
-        return result
+        # The job's objects are gone by now, so the mappings can be dropped
+        buffers = None
+        _close_blocks(blocks)
         
-    except Exception as e:
-        return {
-            'job_id': job_data['job_id'],
-            'status': 'failed',
-            'error': str(e),
-            'started_at': datetime.now().isoformat(),
-            'completed_at': datetime.now().isoformat(),
-        }
+        out_queue.put({
+            'job_id': job_id,
+            'status': status,
+            'error': error,
+        })
 
 
 class RenderQueue:
@@ -164,14 +452,19 @@ class RenderQueue:
         self.default_renderer = default_renderer
         self.progress_callback = JobProgressCallback(progress_callback)
         
-        self._jobs: Dict[str, RenderJob] = {}
-        self._job_order: List[str] = []  # Maintain insertion order
+        self._jobs: Dict[str, RenderJob] = {}  # In insertion order
+        self._pending: Deque[str] = deque()  # IDs not yet handed to a worker
         self._running = False
-        self._cancelled = False
         
         # Threading
         self._lock = threading.Lock()
-        self._executor: Optional[Union[ProcessPoolExecutor, ThreadPoolExecutor]] = None
+        self._stop_event = threading.Event()  # Set by stop(), checked by schedulers
+        self._done_cv = threading.Condition(self._lock)  # Notified when no job is active
+        
+        # Live statistics over the jobs in the queue, kept by _count_locked
+        self._status_counts: 'Counter[JobStatus]' = Counter()
+        self._completed_duration_sum = 0.0
+        self._timed_completed_count = 0  # Completed jobs with a nonzero duration
     
     def add_job(
         self,
@@ -190,7 +483,7 @@ class RenderQueue:
             output_path: Path where the video should be saved
             renderer: Renderer to use (uses default if None)
             options: Rendering options
-            job_id: Custom job ID (generates UUID if None)
+            job_id: Custom job ID (generates a random ID if None)
             metadata: Additional metadata for the job
             
         Returns:
@@ -206,7 +499,7 @@ class RenderQueue:
             raise ValueError("No renderer provided and no default renderer set")
         
         if job_id is None:
-            job_id = str(uuid.uuid4())
+            job_id = _new_job_id()
         
         job = RenderJob(
             id=job_id,
@@ -218,8 +511,13 @@ class RenderQueue:
         )
         
         with self._lock:
+            previous = self._jobs.get(job_id)
+            if previous is not None:
+                self._count_locked(previous, -1)
             self._jobs[job_id] = job
-            self._job_order.append(job_id)
+            self._count_locked(job, 1)
+            if previous is None or previous.status != JobStatus.PENDING:
+                self._pending.append(job_id)  # A replaced pending job keeps its slot
         
         return job_id
     
@@ -232,6 +530,7 @@ class RenderQueue:
         options: Optional[RenderOptions] = None,
         job_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        store_template_data: bool = True,
     ) -> str:
         """
         Add a template-based render job to the queue.
@@ -244,6 +543,10 @@ class RenderQueue:
             options: Rendering options
             job_id: Custom job ID
             metadata: Additional metadata
+            store_template_data: Keep data in the job metadata as
+                'template_data'. If False, only a digest of it is stored as
+                'template_data_hash', so large payloads aren't kept alive
+                by the queue.
             
         Returns:
             Job ID
@@ -254,7 +557,10 @@ class RenderQueue:
         if metadata is None:
             metadata = {}
         metadata['template_name'] = template.info.name
-        metadata['template_data'] = data
+        if store_template_data:
+            metadata['template_data'] = data
+        else:
+            metadata['template_data_hash'] = _digest(data)
         
         return self.add_job(
             timeline=timeline,
@@ -278,12 +584,12 @@ class RenderQueue:
         with self._lock:
             if job_id in self._jobs:
                 job = self._jobs[job_id]
+                self._count_locked(job, -1)
                 if job.status == JobStatus.RUNNING:
                     job.status = JobStatus.CANCELLED
                 
                 del self._jobs[job_id]
-                if job_id in self._job_order:
-                    self._job_order.remove(job_id)
+                self._notify_if_idle_locked()
                 return True
         return False
     
@@ -303,12 +609,13 @@ class RenderQueue:
             List of jobs
         """
         with self._lock:
-            jobs = [self._jobs[job_id] for job_id in self._job_order if job_id in self._jobs]
-            
-            if status is not None:
-                jobs = [job for job in jobs if job.status == status]
-            
-            return jobs
+            jobs = list(self._jobs.values())
+        
+        # Filter outside the lock so workers aren't blocked by the scan
+        if status is not None:
+            jobs = [job for job in jobs if job.status == status]
+        
+        return jobs
     
     def clear_completed(self) -> int:
         """
@@ -319,15 +626,17 @@ class RenderQueue:
         """
         removed_count = 0
         with self._lock:
+            if not any(self._status_counts[status] for status in _FINISHED_STATES):
+                return 0  # Nothing finished, skip the scan
+            
             jobs_to_remove = []
             for job_id, job in self._jobs.items():
                 if job.is_finished:
                     jobs_to_remove.append(job_id)
             
             for job_id in jobs_to_remove:
+                self._count_locked(self._jobs[job_id], -1)
                 del self._jobs[job_id]
-                if job_id in self._job_order:
-                    self._job_order.remove(job_id)
                 removed_count += 1
         
         return removed_count
@@ -335,163 +644,371 @@ class RenderQueue:
     def get_stats(self) -> Dict[str, Any]:
         """Get queue statistics."""
         with self._lock:
-            jobs = list(self._jobs.values())
-            
+            counts = self._status_counts
             stats = {
-                'total_jobs': len(jobs),
-                'pending': sum(1 for j in jobs if j.status == JobStatus.PENDING),
-                'running': sum(1 for j in jobs if j.status == JobStatus.RUNNING),
-                'completed': sum(1 for j in jobs if j.status == JobStatus.COMPLETED),
-                'failed': sum(1 for j in jobs if j.status == JobStatus.FAILED),
-                'cancelled': sum(1 for j in jobs if j.status == JobStatus.CANCELLED),
+                'total_jobs': len(self._jobs),
+                'pending': counts[JobStatus.PENDING],
+                'running': counts[JobStatus.RUNNING],
+                'completed': counts[JobStatus.COMPLETED],
+                'failed': counts[JobStatus.FAILED],
+                'cancelled': counts[JobStatus.CANCELLED],
                 'queue_running': self._running,
             }
             
-            # Calculate average duration for completed jobs
-            completed_jobs = [j for j in jobs if j.status == JobStatus.COMPLETED and j.duration]
-            if completed_jobs:
-                stats['avg_duration'] = sum(j.duration for j in completed_jobs) / len(completed_jobs)
+            # Average duration for completed jobs
+            if self._timed_completed_count:
+                stats['avg_duration'] = self._completed_duration_sum / self._timed_completed_count
             else:
                 stats['avg_duration'] = None
-            
-            return stats
+        
+        return stats
     
-    def run(self, mode: QueueMode = QueueMode.SEQUENTIAL, workers: int = None) -> None:
+    def run(
+        self,
+        mode: QueueMode = QueueMode.SEQUENTIAL,
+        workers: int = None,
+        pin_workers: bool = False,
+        preload_workers: bool = False,
+    ) -> None:
         """
         Process all jobs in the queue.
         
         Args:
             mode: Processing mode (sequential or parallel)
             workers: Number of worker processes/threads (auto-detected if None)
+            pin_workers: Pin each worker process to its own CPU (process mode
+                only, where supported). Leave off for renderers that spawn
+                multi-threaded encoders, since child processes inherit the pin.
+            preload_workers: Have the forkserver import NumPy and MoviePy once
+                so workers start with them loaded (process mode only). This
+                sets the forkserver preload for the whole program and only
+                takes effect before its forkserver first starts.
+            
+        Raises:
+            RuntimeError: If the queue is already running
+            ValueError: If workers is less than 1
         """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        
         if self._running:
             raise RuntimeError("Queue is already running")
         
         self._running = True
-        self._cancelled = False
+        self._stop_event.clear()
         
         try:
             if mode == QueueMode.SEQUENTIAL:
                 self._run_sequential()
             elif mode == QueueMode.PARALLEL_PROCESS:
-                self._run_parallel_process(workers)
+                self._run_parallel_process(workers, pin_workers, preload_workers)
             elif mode == QueueMode.PARALLEL_THREAD:
                 self._run_parallel_thread(workers)
             else:
                 raise ValueError(f"Unsupported queue mode: {mode}")
         finally:
-            self._running = False
-            if self._executor:
-                self._executor.shutdown(wait=True)
-                self._executor = None
+            with self._done_cv:
+                self._running = False
+                self._done_cv.notify_all()
     
     def stop(self) -> None:
-        """Stop processing jobs."""
-        self._cancelled = True
-        if self._executor:
-            self._executor.shutdown(wait=False)
+        """
+        Stop processing jobs.
+        
+        No new jobs are started; jobs already running finish normally and
+        run() returns once they have. Safe to call from any thread.
+        """
+        self._stop_event.set()
     
     def _run_sequential(self) -> None:
         """Run jobs sequentially in the current thread."""
-        while not self._cancelled:
+        while not self._stop_event.is_set():
             job = self._get_next_pending_job()
             if job is None:
                 break  # No more pending jobs
             
             self._process_job(job)
     
-    def _run_parallel_process(self, workers: Optional[int] = None) -> None:
-        """Run jobs in parallel using multiprocessing."""
-        if workers is None:
-            workers = mp.cpu_count()
+    def _run_parallel_process(
+        self,
+        workers: Optional[int] = None,
+        pin_workers: bool = False,
+        preload_workers: bool = False,
+    ) -> None:
+        """
+        Run jobs in parallel using a pool of long-lived worker processes.
         
-        # Note: This is a simplified implementation
-        # In practice, multiprocessing with Timeline objects is complex
-        # due to serialization requirements
+        Workers are started once and pull jobs from a shared queue, so each
+        renderer is pickled once per worker instead of once per job. The
+        timeline and renderer of every job must be picklable. If only one
+        worker would be used, jobs run sequentially in the calling thread.
+        """
+        workers = self._effective_workers(workers, mp.cpu_count())
+        if workers == 1:
+            self._run_sequential()
+            return
+        
+        ctx = _get_process_context(preload_workers)
+        in_queue = ctx.Queue()
+        out_queue = ctx.Queue()
+        
+        renderers = self._shared_renderers()
+        processes = [
+            ctx.Process(
+                target=_process_worker_loop,
+                args=(in_queue, out_queue, renderers, index, pin_workers),
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        
+        in_flight: Dict[str, RenderJob] = {}
+        shared_blocks: Dict[str, List[Any]] = {}
+        try:
+            while True:
+                # Keep at most one job per worker queued so stop() takes effect
+                while len(in_flight) < workers and not self._stop_event.is_set():
+                    jobs = self._take_pending_jobs(workers - len(in_flight))
+                    if not jobs:
+                        break
+                    for job in jobs:
+                        blocks = self._dispatch_to_process(job, in_queue, renderers)
+                        if blocks is not None:
+                            in_flight[job.id] = job
+                            shared_blocks[job.id] = blocks
+                
+                if not in_flight:
+                    break
+                
+                try:
+                    result = out_queue.get(timeout=1.0)
+                except queue.Empty:
+                    if any(process.exitcode is not None for process in processes):
+                        error = RenderError("Render worker process exited unexpectedly")
+                        for job in in_flight.values():
+                            self._handle_job_error(job, error)
+                        break
+                    continue
+                
+                job = in_flight.pop(result['job_id'])
+                _release_blocks(shared_blocks.pop(job.id))
+                # Start and end are both stamped here in the parent, at dispatch
+                # and at receipt, so the wall-clock times and duration agree
+                if result['status'] == JobStatus.COMPLETED.value:
+                    self._mark_completed(job)
+                else:
+                    self._handle_job_error(job, RenderError(result['error']))
+        finally:
+            for _ in processes:
+                in_queue.put(None)
+            for process in processes:
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    process.terminate()
+            for blocks in shared_blocks.values():
+                _release_blocks(blocks)
+    
+    def _shared_renderers(self) -> Dict[int, Renderer]:
+        """Collect the picklable renderers used by pending jobs, keyed by id()."""
+        with self._lock:
+            candidates = {
+                id(job.renderer): job.renderer
+                for job in (self._jobs.get(job_id) for job_id in self._pending)
+                if job is not None
+            }
+        
+        renderers = {}
+        for key, renderer in candidates.items():
+            try:
+                pickle.dumps(renderer, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                continue  # Sent with each job instead, where the failure is reported
+            renderers[key] = renderer
+        return renderers
+    
+    def _dispatch_to_process(
+        self,
+        job: RenderJob,
+        in_queue: 'mp.Queue',
+        renderers: Dict[int, Renderer],
+    ) -> Optional[List[Any]]:
+        """
+        Send a job to the worker processes.
+        
+        The job is pickled here rather than in the queue's feeder thread so
+        that serialization errors fail the job instead of being lost.
+        
+        Returns:
+            Shared memory blocks holding the job's large buffers, to be
+            released once the job finishes, or None if it failed to serialize
+        """
+        renderer_key = id(job.renderer)
+        renderer = None if renderer_key in renderers else job.renderer
+        try:
+            payload, buffer_spec, blocks = _pack_payload(
+                (renderer_key, renderer, job.timeline, job.output_path, job.options)
+            )
+        except Exception as e:
+            self._handle_job_error(job, e)
+            return None
         
-        print(f"Warning: Multiprocessing mode is not fully implemented.")
-        print("Falling back to sequential processing.")
-        self._run_sequential()
+        self._mark_running(job)
+        in_queue.put((job.id, payload, buffer_spec))
+        return blocks
     
     def _run_parallel_thread(self, workers: Optional[int] = None) -> None:
-        """Run jobs in parallel using threading."""
-        if workers is None:
-            workers = min(4, mp.cpu_count())  # Conservative default for threading
+        """
+        Run jobs in parallel using threading.
+        
+        If only one worker would be used, jobs run sequentially in the
+        calling thread.
+        """
+        # Conservative default for threading
+        workers = self._effective_workers(workers, min(4, mp.cpu_count()))
+        if workers == 1:
+            self._run_sequential()
+            return
         
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            self._executor = executor
-            futures = {}
+            futures: Dict[Future, RenderJob] = {}
             
-            while not self._cancelled:
-                # Submit new jobs
-                pending_jobs = self.list_jobs(JobStatus.PENDING)
-                running_jobs = self.list_jobs(JobStatus.RUNNING)
-                
-                # Don't exceed worker limit
-                available_slots = workers - len(running_jobs)
-                jobs_to_submit = pending_jobs[:available_slots]
-                
-                for job in jobs_to_submit:
-                    future = executor.submit(self._process_job, job)
-                    futures[future] = job
-                
-                if not futures and not running_jobs:
-                    break  # No more jobs to process
-                
-                # Wait for some jobs to complete
-                if futures:
-                    for future in as_completed(futures, timeout=1.0):
-                        completed_job = futures.pop(future)
-                        try:
-                            future.result()  # Get result or raise exception
-                        except Exception as e:
-                            self._handle_job_error(completed_job, e)
+            def fill_slots() -> None:
+                """Submit pending jobs until every worker is busy."""
+                if self._stop_event.is_set():
+                    return
+                for job in self._take_pending_jobs(workers - len(futures)):
+                    futures[executor.submit(self._process_job, job)] = job
+            
+            fill_slots()
+            while futures:
+                # Block until at least one job finishes, then drain every
+                # finished future and refill all freed slots in one batch
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed_job = futures.pop(future)
+                    try:
+                        future.result()  # Get result or raise exception
+                    except Exception as e:
+                        self._handle_job_error(completed_job, e)
                 
-                time.sleep(0.1)  # Small delay to prevent busy waiting
+                fill_slots()
+    
+    def _effective_workers(self, workers: Optional[int], default: int) -> int:
+        """Resolve a worker count, never exceeding the number of pending jobs."""
+        with self._lock:
+            pending = self._status_counts[JobStatus.PENDING]
+        return max(1, min(workers or default, pending))
     
     def _get_next_pending_job(self) -> Optional[RenderJob]:
-        """Get the next pending job from the queue."""
+        """Take the next pending job off the queue."""
+        jobs = self._take_pending_jobs(1)
+        return jobs[0] if jobs else None
+    
+    def _take_pending_jobs(self, count: int) -> List[RenderJob]:
+        """
+        Take up to count pending jobs off the queue in one lock acquisition.
+        
+        Each job is handed out at most once; IDs of jobs removed since they
+        were queued are skipped.
+        
+        Args:
+            count: Maximum number of jobs to take
+            
+        Returns:
+            Jobs in queue order
+        """
+        jobs = []
         with self._lock:
-            for job_id in self._job_order:
-                if job_id in self._jobs:
-                    job = self._jobs[job_id]
-                    if job.status == JobStatus.PENDING:
-                        return job
-        return None
+            while self._pending and len(jobs) < count:
+                job = self._jobs.get(self._pending.popleft())
+                if job is not None and job.status == JobStatus.PENDING:
+                    jobs.append(job)
+        return jobs
     
     def _process_job(self, job: RenderJob) -> None:
         """Process a single render job."""
         try:
-            # Mark job as running
-            with self._lock:
-                job.status = JobStatus.RUNNING
-                job.started_at = datetime.now()
-            
-            self.progress_callback.on_job_started(job)
+            self._mark_running(job)
             
             # Perform the actual rendering
             job.renderer.render(job.timeline, job.output_path, job.options)
             
-            # Mark job as completed
-            with self._lock:
-                job.status = JobStatus.COMPLETED
-                job.completed_at = datetime.now()
-                job.progress = 100.0
-            
-            self.progress_callback.on_job_completed(job)
+            self._mark_completed(job)
             
         except Exception as e:
             self._handle_job_error(job, e)
     
+    def _mark_running(self, job: RenderJob) -> None:
+        """Mark a job as started and notify the progress callback."""
+        started_at = datetime.now()
+        started_mono = time.monotonic()
+        with self._lock:
+            job.started_at = started_at
+            job._started_mono = started_mono
+            self._set_status_locked(job, JobStatus.RUNNING)
+        
+        self.progress_callback.on_job_started(job)
+    
+    def _mark_completed(self, job: RenderJob) -> None:
+        """Mark a job as completed and notify the progress callback."""
+        completed_at = datetime.now()
+        completed_mono = time.monotonic()
+        with self._lock:
+            job.completed_at = completed_at
+            job._completed_mono = completed_mono
+            job.progress = 100.0
+            self._set_status_locked(job, JobStatus.COMPLETED)
+        
+        self.progress_callback.on_job_completed(job)
+    
     def _handle_job_error(self, job: RenderJob, error: Exception) -> None:
         """Handle job error."""
+        completed_at = datetime.now()
+        completed_mono = time.monotonic()
+        error_message = str(error)
         with self._lock:
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.now()
-            job.error_message = str(error)
+            job.completed_at = completed_at
+            job._completed_mono = completed_mono
+            job.error_message = error_message
+            self._set_status_locked(job, JobStatus.FAILED)
         
         self.progress_callback.on_job_failed(job, error)
     
+    def _set_status_locked(self, job: RenderJob, status: JobStatus) -> None:
+        """
+        Change a job's status, keeping the queue statistics in step.
+        
+        Must be called with the lock held, after the job's other fields for
+        the transition are set. Jobs removed from the queue are updated
+        without being counted.
+        """
+        if self._jobs.get(job.id) is not job:
+            job.status = status
+            return
+        
+        self._count_locked(job, -1)
+        job.status = status
+        self._count_locked(job, 1)
+        self._notify_if_idle_locked()
+    
+    def _count_locked(self, job: RenderJob, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a job from the live statistics."""
+        self._status_counts[job.status] += sign
+        if job.status == JobStatus.COMPLETED and job.duration:
+            self._completed_duration_sum += sign * job.duration
+            self._timed_completed_count += sign
+    
+    def _active_job_count_locked(self) -> int:
+        """Number of queued jobs that are pending or running."""
+        return self._status_counts[JobStatus.PENDING] + self._status_counts[JobStatus.RUNNING]
+    
+    def _notify_if_idle_locked(self) -> None:
+        """Wake wait_for_completion callers once no job is active."""
+        if self._active_job_count_locked() == 0:
+            self._done_cv.notify_all()
+    
     def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for all jobs to complete.
@@ -500,25 +1017,14 @@ class RenderQueue:
             timeout: Maximum time to wait in seconds
             
         Returns:
-            True if all jobs completed, False if timeout reached
+            True if all jobs completed or the queue stopped running, False if
+            timeout reached
         """
-        start_time = time.time()
-        
-        while self._running:
-            if timeout and (time.time() - start_time) > timeout:
-                return False
-            
-            pending_or_running = len([
-                j for j in self._jobs.values() 
-                if j.status in [JobStatus.PENDING, JobStatus.RUNNING]
-            ])
-            
-            if pending_or_running == 0:
-                return True
-            
-            time.sleep(0.1)
-        
-        return True
+        with self._done_cv:
+            return self._done_cv.wait_for(
+                lambda: not self._running or self._active_job_count_locked() == 0,
+                timeout=timeout,
+            )
     
     def __len__(self) -> int:
         """Return the number of jobs in the queue."""
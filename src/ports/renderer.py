@@ -5,12 +5,20 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from ..core._slots import get_slot_state, set_slot_state
 from ..core.timeline import Timeline
 
 
 class RenderOptions:
     """Configuration options for rendering."""
     
+    # Serializable option names, in to_dict() order
+    _FIELDS = (
+        'codec', 'bitrate', 'quality', 'preset', 'audio_codec', 'audio_bitrate',
+        'output_format', 'temp_audiofile', 'remove_temp', 'verbose', 'threads',
+    )
+    __slots__ = _FIELDS + ('logger',)
+    
     def __init__(
         self,
         codec: str = "libx264",
@@ -58,19 +66,15 @@ class RenderOptions:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert options to dictionary."""
-        return {
-            'codec': self.codec,
-            'bitrate': self.bitrate,
-            'quality': self.quality,
-            'preset': self.preset,
-            'audio_codec': self.audio_codec,
-            'audio_bitrate': self.audio_bitrate,
-            'output_format': self.output_format,
-            'temp_audiofile': self.temp_audiofile,
-            'remove_temp': self.remove_temp,
-            'verbose': self.verbose,
-            'threads': self.threads,
-        }
+        return {name: getattr(self, name) for name in self._FIELDS}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Collect the slots of every class in the MRO, plus any __dict__."""
+        return get_slot_state(self)
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore options pickled by __getstate__."""
+        set_slot_state(self, state)
     
     @classmethod
     def web_optimized(cls) -> 'RenderOptions':
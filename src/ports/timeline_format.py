@@ -2,14 +2,17 @@
 TimelineFormat port interface for professional video format interchange.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import ClassVar, Dict, Any, Mapping, Optional, List, Tuple
 from pathlib import Path
 from enum import Enum
 
+from .._compat import DATACLASS_SLOTS
 from ..core.timeline import Timeline
 
 
-class SupportedFormat(Enum):
+class SupportedFormat(str, Enum):
     """Supported professional video formats."""
     FCPXML = "fcpxml"  # Final Cut Pro XML
     ALE = "ale"        # Avid Log Exchange
@@ -19,87 +22,82 @@ class SupportedFormat(Enum):
     XML = "xml"        # Generic XML
 
 
+# File extensions used by each format
+_FORMAT_EXTENSIONS: Dict[SupportedFormat, Tuple[str, ...]] = {
+    SupportedFormat.FCPXML: ('.fcpxml',),
+    SupportedFormat.ALE: ('.ale',),
+    SupportedFormat.AAF: ('.aaf',),
+    SupportedFormat.OTIO_JSON: ('.otio',),
+    SupportedFormat.EDL: ('.edl',),
+    SupportedFormat.XML: ('.xml',),
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FormatCapability:
     """Describes what features a format supports."""
-    
-    def __init__(
-        self,
-        supports_video: bool = True,
-        supports_audio: bool = True,
-        supports_text: bool = True,
-        supports_transitions: bool = True,
-        supports_effects: bool = False,
-        supports_metadata: bool = True,
-        supports_markers: bool = False,
-        read_only: bool = False,
-    ):
-        self.supports_video = supports_video
-        self.supports_audio = supports_audio
-        self.supports_text = supports_text
-        self.supports_transitions = supports_transitions
-        self.supports_effects = supports_effects
-        self.supports_metadata = supports_metadata
-        self.supports_markers = supports_markers
-        self.read_only = read_only
+    supports_video: bool = True
+    supports_audio: bool = True
+    supports_text: bool = True
+    supports_transitions: bool = True
+    supports_effects: bool = False
+    supports_metadata: bool = True
+    supports_markers: bool = False
+    read_only: bool = False
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ImportOptions:
-    """Options for importing timeline formats."""
+    """
+    Options for importing timeline formats.
     
-    def __init__(
-        self,
-        preserve_paths: bool = True,
-        relative_to: Optional[Path] = None,
-        ignore_missing_media: bool = False,
-        default_framerate: float = 30.0,
-        track_mapping: Optional[Dict[str, str]] = None,
-    ):
-        """
-        Initialize import options.
-        
-        Args:
-            preserve_paths: Keep original file paths
-            relative_to: Make paths relative to this directory
-            ignore_missing_media: Continue import even if media files are missing
-            default_framerate: Default framerate if not specified in format
-            track_mapping: Map track names/types during import
-        """
-        self.preserve_paths = preserve_paths
-        self.relative_to = relative_to
-        self.ignore_missing_media = ignore_missing_media
-        self.default_framerate = default_framerate
-        self.track_mapping = track_mapping or {}
+    Attributes:
+        preserve_paths: Keep original file paths
+        relative_to: Make paths relative to this directory
+        ignore_missing_media: Continue import even if media files are missing
+        default_framerate: Default framerate if not specified in format
+        track_mapping: Map track names/types during import, stored as a
+            read-only copy
+    """
+    preserve_paths: bool = True
+    relative_to: Optional[Path] = None
+    ignore_missing_media: bool = False
+    default_framerate: float = 30.0
+    track_mapping: Optional[Mapping[str, str]] = field(default=None, hash=False)
+    
+    def __post_init__(self):
+        # A read-only copy keeps the frozen options from changing underneath
+        object.__setattr__(
+            self, 'track_mapping', MappingProxyType(dict(self.track_mapping or {}))
+        )
+    
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled, so rebuild from a plain dict
+        return type(self), tuple(
+            dict(value) if isinstance(value, MappingProxyType) else value
+            for value in (getattr(self, f.name) for f in fields(self) if f.init)
+        )
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExportOptions:
-    """Options for exporting timeline formats."""
+    """
+    Options for exporting timeline formats.
     
-    def __init__(
-        self,
-        include_disabled_tracks: bool = False,
-        export_media_references: bool = True,
-        make_paths_relative: bool = False,
-        relative_to: Optional[Path] = None,
-        include_metadata: bool = True,
-        format_version: Optional[str] = None,
-    ):
-        """
-        Initialize export options.
-        
-        Args:
-            include_disabled_tracks: Export disabled tracks
-            export_media_references: Include references to media files
-            make_paths_relative: Convert absolute paths to relative
-            relative_to: Base directory for relative paths
-            include_metadata: Include timeline metadata
-            format_version: Specific format version to target
-        """
-        self.include_disabled_tracks = include_disabled_tracks
-        self.export_media_references = export_media_references
-        self.make_paths_relative = make_paths_relative
-        self.relative_to = relative_to
-        self.include_metadata = include_metadata
-        self.format_version = format_version
+    Attributes:
+        include_disabled_tracks: Export disabled tracks
+        export_media_references: Include references to media files
+        make_paths_relative: Convert absolute paths to relative
+        relative_to: Base directory for relative paths
+        include_metadata: Include timeline metadata
+        format_version: Specific format version to target
+    """
+    include_disabled_tracks: bool = False
+    export_media_references: bool = True
+    make_paths_relative: bool = False
+    relative_to: Optional[Path] = None
+    include_metadata: bool = True
+    format_version: Optional[str] = None
 
 
 class TimelineFormat(ABC):
@@ -110,6 +108,9 @@ class TimelineFormat(ABC):
     video editing formats, enabling interoperability with industry tools.
     """
     
+    # Main format of the adapter; when None, the first supported format is used
+    primary_format: ClassVar[Optional[SupportedFormat]] = None
+    
     @abstractmethod
     def read(self, file_path: Path, options: Optional[ImportOptions] = None) -> Timeline:
         """
@@ -206,21 +207,11 @@ class TimelineFormat(ABC):
             List of file extensions (e.g., ['.fcpxml', '.xml'])
         """
         # Default implementation based on supported formats
-        extensions = []
-        for fmt in self.get_supported_formats():
-            if fmt == SupportedFormat.FCPXML:
-                extensions.extend(['.fcpxml'])
-            elif fmt == SupportedFormat.ALE:
-                extensions.extend(['.ale'])
-            elif fmt == SupportedFormat.AAF:
-                extensions.extend(['.aaf'])
-            elif fmt == SupportedFormat.OTIO_JSON:
-                extensions.extend(['.otio'])
-            elif fmt == SupportedFormat.EDL:
-                extensions.extend(['.edl'])
-            elif fmt == SupportedFormat.XML:
-                extensions.extend(['.xml'])
-        return extensions
+        return [
+            extension
+            for fmt in self.get_supported_formats()
+            for extension in _FORMAT_EXTENSIONS.get(fmt, ())
+        ]
     
     def get_name(self) -> str:
         """Get the name of this format adapter."""
@@ -249,14 +240,15 @@ class TimelineFormat(ABC):
         if timeline.duration <= 0:
             warnings.append("Timeline has zero duration")
         
-        # Check for unsupported clip types based on capabilities
-        for track in timeline.tracks:
-            for clip in track.clips:
-                if clip.get_type() == "video" and not self.get_format_capabilities(
-                    self.get_supported_formats()[0]
-                ).supports_video:
-                    warnings.append(f"Format does not support video clips")
-                    break
+        # Check for unsupported clip types based on the primary format's capabilities
+        primary = self.primary_format
+        if primary is None:
+            formats = self.get_supported_formats()
+            primary = formats[0] if formats else None
+        capabilities = self.get_format_capabilities(primary) if primary is not None else None
+        if capabilities is not None and not capabilities.supports_video:
+            if any(clip.get_type() == "video" for clip in timeline.get_all_clips()):
+                warnings.append("Format does not support video clips")
         
         return warnings
 
@@ -264,9 +256,22 @@ class TimelineFormat(ABC):
 class FormatError(Exception):
     """Exception raised when format operations fail."""
     
+    __slots__ = ('_details',)
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
-        self.details = details or {}
+        self._details = details or None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Extra error context; the dict is only allocated when first needed."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+    
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
 
 
 class UnsupportedFeatureError(FormatError):
@@ -2,13 +2,31 @@
 TranscriptionService port interface for AI speech-to-text services.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from functools import cached_property
+from importlib.util import find_spec
+from typing import List, Dict, Any, FrozenSet, Optional, Sequence, TextIO, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
 
+from .._compat import DATACLASS_SLOTS
 
-class TranscriptionLanguage(Enum):
+# NumPy is imported on first use; importing it up front would dominate import time
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+
+
+# Below this many segments a list comprehension beats building a NumPy array
+VECTORIZE_THRESHOLD = 256
+
+# Subtitle timestamp templates; %-formatting is the cheapest fixed-width path
+_SRT_TIME_FORMAT = "%02d:%02d:%02d,%03d"
+_VTT_TIME_FORMAT = "%02d:%02d:%02d.%03d"
+
+
+class TranscriptionLanguage(str, Enum):
     """Supported languages for transcription."""
     AUTO = "auto"
     ENGLISH = "en"
@@ -30,7 +48,7 @@ class TranscriptionLanguage(Enum):
     FINNISH = "fi"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SubtitleSegment:
     """Represents a single subtitle segment with timing and text."""
     text: str
@@ -39,11 +57,10 @@ class SubtitleSegment:
     confidence: Optional[float] = None  # 0.0 to 1.0
     speaker_id: Optional[str] = None
     language: Optional[str] = None
+    duration: float = field(init=False, repr=False, compare=False)  # end_time - start_time
     
-    @property
-    def duration(self) -> float:
-        """Get the duration of this segment."""
-        return self.end_time - self.start_time
+    def __post_init__(self):
+        object.__setattr__(self, 'duration', self.end_time - self.start_time)
     
     def to_srt_format(self, index: int) -> str:
         """Convert to SRT format string."""
@@ -57,157 +74,281 @@ class SubtitleSegment:
         end_time = self._seconds_to_vtt_time(self.end_time)
         return f"{start_time} --> {end_time}\n{self.text}\n\n"
     
-    def _seconds_to_srt_time(self, seconds: float) -> str:
+    @staticmethod
+    def _seconds_to_srt_time(seconds: float) -> str:
         """Convert seconds to SRT time format (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        hours, millisecs = divmod(int(seconds * 1000), 3_600_000)
+        minutes, millisecs = divmod(millisecs, 60_000)
+        secs, millisecs = divmod(millisecs, 1000)
+        return _SRT_TIME_FORMAT % (hours, minutes, secs, millisecs)
     
-    def _seconds_to_vtt_time(self, seconds: float) -> str:
+    @staticmethod
+    def _seconds_to_vtt_time(seconds: float) -> str:
         """Convert seconds to VTT time format (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+        hours, millisecs = divmod(int(seconds * 1000), 3_600_000)
+        minutes, millisecs = divmod(millisecs, 60_000)
+        secs, millisecs = divmod(millisecs, 1000)
+        return _VTT_TIME_FORMAT % (hours, minutes, secs, millisecs)
 
 
-@dataclass
+# Segments sorted by start time, their start times, and running maximum end times
+_TimeIndex = Tuple[Sequence[SubtitleSegment], List[float], List[float]]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TranscriptionResult:
-    """Complete transcription result with metadata."""
-    segments: List[SubtitleSegment]
+    """
+    Complete transcription result with metadata.
+    
+    Segments are stored as a tuple, so a result cannot be edited in place.
+    Assigning new segments replaces the tuple and resets the derived data.
+    """
+    segments: Sequence[SubtitleSegment]
     language: str
     duration: float
     confidence: Optional[float] = None
     processing_time: Optional[float] = None
     model_used: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    # Derived from segments on first use, reset whenever segments is assigned
+    _full_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _conf_array: Any = field(default=None, init=False, repr=False, compare=False)
+    _time_index: Optional[_TimeIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'segments':
+            value = tuple(value)
+            object.__setattr__(self, '_full_text', None)
+            object.__setattr__(self, '_conf_array', None)
+            object.__setattr__(self, '_time_index', None)
+        object.__setattr__(self, name, value)
     
     @property
     def full_text(self) -> str:
         """Get the complete transcribed text."""
-        return " ".join(segment.text for segment in self.segments)
+        if self._full_text is None:
+            self._full_text = " ".join(segment.text for segment in self.segments)
+        return self._full_text
+    
+    def _get_time_index(self) -> _TimeIndex:
+        """
+        Get segments sorted by start time with their start times and the
+        running maximum of their end times, for bisect lookups.
+        """
+        if self._time_index is None:
+            segments = self.segments
+            starts = [segment.start_time for segment in segments]
+            if any(a > b for a, b in zip(starts, starts[1:])):
+                segments = sorted(segments, key=lambda segment: segment.start_time)
+                starts = [segment.start_time for segment in segments]
+            max_ends = list(accumulate((segment.end_time for segment in segments), max))
+            self._time_index = (segments, starts, max_ends)
+        return self._time_index
+    
+    def segments_at(self, time: float) -> List[SubtitleSegment]:
+        """
+        Get segments active at a point in time.
+        
+        Args:
+            time: Time in seconds
+            
+        Returns:
+            Segments with start_time <= time < end_time, ordered by start time
+        """
+        segments, starts, max_ends = self._get_time_index()
+        # Segments before lo all end by time; none from hi onward have started
+        lo = bisect_right(max_ends, time)
+        hi = bisect_right(starts, time)
+        return [segment for segment in segments[lo:hi] if segment.end_time > time]
+    
+    def segments_in(self, start: float, end: float) -> List[SubtitleSegment]:
+        """
+        Get segments starting within a time range.
+        
+        Args:
+            start: Range start in seconds (inclusive)
+            end: Range end in seconds (inclusive)
+            
+        Returns:
+            Segments with start <= start_time <= end, ordered by start time
+        """
+        segments, starts, _ = self._get_time_index()
+        return list(segments[bisect_left(starts, start):bisect_right(starts, end)])
     
     def to_srt(self) -> str:
         """Convert to SRT subtitle format."""
-        srt_content = ""
-        for i, segment in enumerate(self.segments, 1):
-            srt_content += segment.to_srt_format(i)
-        return srt_content
+        return "".join(segment.to_srt_format(i) for i, segment in enumerate(self.segments, 1))
     
     def to_vtt(self) -> str:
         """Convert to WebVTT subtitle format."""
-        vtt_content = "WEBVTT\n\n"
-        for segment in self.segments:
-            vtt_content += segment.to_vtt_format()
-        return vtt_content
-    
-    def filter_by_confidence(self, min_confidence: float) -> 'TranscriptionResult':
-        """Filter segments by minimum confidence level."""
-        filtered_segments = [
-            segment for segment in self.segments 
-            if segment.confidence is None or segment.confidence >= min_confidence
-        ]
+        return "WEBVTT\n\n" + "".join(segment.to_vtt_format() for segment in self.segments)
+    
+    def write_srt(self, fp: TextIO) -> None:
+        """
+        Write SRT subtitles to a text stream one segment at a time.
+        
+        Unlike to_srt, this never holds the whole document in memory.
         
+        Args:
+            fp: Writable text stream, such as a file opened in text mode
+        """
+        fp.writelines(segment.to_srt_format(i) for i, segment in enumerate(self.segments, 1))
+    
+    def write_vtt(self, fp: TextIO) -> None:
+        """
+        Write WebVTT subtitles to a text stream one segment at a time.
+        
+        Args:
+            fp: Writable text stream, such as a file opened in text mode
+        """
+        fp.write("WEBVTT\n\n")
+        fp.writelines(segment.to_vtt_format() for segment in self.segments)
+    
+    def _with_segments(
+        self,
+        segments: List[SubtitleSegment],
+        copy_metadata: bool
+    ) -> 'TranscriptionResult':
+        """Build a result with new segments and this result's other fields."""
         return TranscriptionResult(
-            segments=filtered_segments,
+            segments=segments,
             language=self.language,
             duration=self.duration,
             confidence=self.confidence,
             processing_time=self.processing_time,
             model_used=self.model_used,
-            metadata=self.metadata.copy()
+            metadata=self.metadata.copy() if copy_metadata else self.metadata
         )
     
-    def merge_short_segments(self, min_duration: float = 1.0) -> 'TranscriptionResult':
-        """Merge segments that are shorter than min_duration."""
+    def filter_by_confidence(
+        self,
+        min_confidence: float,
+        copy_metadata: bool = False
+    ) -> 'TranscriptionResult':
+        """
+        Filter segments by minimum confidence level.
+        
+        The returned result shares this result's metadata dict unless
+        copy_metadata is True.
+        """
+        segments = self.segments
+        if NUMPY_AVAILABLE and len(segments) >= VECTORIZE_THRESHOLD:
+            import numpy as np
+            
+            if self._conf_array is None:
+                # Segments without a confidence always pass the filter
+                self._conf_array = np.fromiter(
+                    (np.inf if s.confidence is None else s.confidence for s in segments),
+                    dtype=np.float64,
+                    count=len(segments)
+                )
+            keep = np.flatnonzero(self._conf_array >= min_confidence)
+            filtered_segments = [segments[i] for i in keep.tolist()]
+        else:
+            filtered_segments = [
+                segment for segment in segments 
+                if segment.confidence is None or segment.confidence >= min_confidence
+            ]
+        
+        return self._with_segments(filtered_segments, copy_metadata)
+    
+    def merge_short_segments(
+        self,
+        min_duration: float = 1.0,
+        copy_metadata: bool = False
+    ) -> 'TranscriptionResult':
+        """
+        Merge segments that are shorter than min_duration.
+        
+        The returned result shares this result's metadata dict unless
+        copy_metadata is True.
+        """
         if not self.segments:
             return self
         
         merged_segments = []
-        current_segment = self.segments[0]
+        
+        def flush() -> None:
+            # Keep unmerged segments as-is; build one segment per merged run
+            if len(texts) == 1:
+                merged_segments.append(head)
+            else:
+                merged_segments.append(SubtitleSegment(
+                    text=" ".join(texts),
+                    start_time=head.start_time,
+                    end_time=end_time,
+                    confidence=confidence,
+                    speaker_id=head.speaker_id,
+                    language=head.language
+                ))
+        
+        head = self.segments[0]
+        texts = [head.text]
+        end_time = head.end_time
+        confidence = head.confidence
         
         for segment in self.segments[1:]:
-            if current_segment.duration < min_duration:
-                # Merge with next segment
-                current_segment = SubtitleSegment(
-                    text=f"{current_segment.text} {segment.text}",
-                    start_time=current_segment.start_time,
-                    end_time=segment.end_time,
-                    confidence=min(
-                        current_segment.confidence or 1.0,
-                        segment.confidence or 1.0
-                    ) if current_segment.confidence and segment.confidence else None,
-                    speaker_id=current_segment.speaker_id,
-                    language=current_segment.language
-                )
+            if end_time - head.start_time < min_duration:
+                # Merge with next segment, keeping the lowest known confidence
+                texts.append(segment.text)
+                end_time = segment.end_time
+                if segment.confidence is not None and (
+                    confidence is None or segment.confidence < confidence
+                ):
+                    confidence = segment.confidence
             else:
-                merged_segments.append(current_segment)
-                current_segment = segment
+                flush()
+                head = segment
+                texts = [segment.text]
+                end_time = segment.end_time
+                confidence = segment.confidence
         
-        merged_segments.append(current_segment)
+        flush()
         
-        return TranscriptionResult(
-            segments=merged_segments,
-            language=self.language,
-            duration=self.duration,
-            confidence=self.confidence,
-            processing_time=self.processing_time,
-            model_used=self.model_used,
-            metadata=self.metadata.copy()
-        )
+        return self._with_segments(merged_segments, copy_metadata)
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TranscriptionOptions:
-    """Configuration options for transcription services."""
+    """
+    Configuration options for transcription services.
     
-    def __init__(
-        self,
-        language: TranscriptionLanguage = TranscriptionLanguage.AUTO,
-        model: Optional[str] = None,
-        temperature: float = 0.0,
-        response_format: str = "segments",
-        timestamp_granularities: Optional[List[str]] = None,
-        max_segment_length: Optional[float] = None,
-        min_segment_length: Optional[float] = None,
-        speaker_detection: bool = False,
-        word_timestamps: bool = True,
-        punctuation: bool = True,
-        profanity_filter: bool = False,
-    ):
-        """
-        Initialize transcription options.
-        
-        Args:
-            language: Language for transcription
-            model: Specific model to use (service-dependent)
-            temperature: Sampling temperature (0.0 to 1.0)
-            response_format: Format of the response
-            timestamp_granularities: Level of timestamp detail
-            max_segment_length: Maximum segment duration in seconds
-            min_segment_length: Minimum segment duration in seconds
-            speaker_detection: Enable speaker identification
-            word_timestamps: Include word-level timestamps
-            punctuation: Add punctuation to transcription
-            profanity_filter: Filter profanity from results
-        """
-        self.language = language
-        self.model = model
-        self.temperature = temperature
-        self.response_format = response_format
-        self.timestamp_granularities = timestamp_granularities or ["segment"]
-        self.max_segment_length = max_segment_length
-        self.min_segment_length = min_segment_length
-        self.speaker_detection = speaker_detection
-        self.word_timestamps = word_timestamps
-        self.punctuation = punctuation
-        self.profanity_filter = profanity_filter
+    Attributes:
+        language: Language for transcription
+        model: Specific model to use (service-dependent)
+        temperature: Sampling temperature (0.0 to 1.0)
+        response_format: Format of the response
+        timestamp_granularities: Levels of timestamp detail, stored as a tuple
+        max_segment_length: Maximum segment duration in seconds
+        min_segment_length: Minimum segment duration in seconds
+        speaker_detection: Enable speaker identification
+        word_timestamps: Include word-level timestamps
+        punctuation: Add punctuation to transcription
+        profanity_filter: Filter profanity from results
+    """
+    language: TranscriptionLanguage = TranscriptionLanguage.AUTO
+    model: Optional[str] = None
+    temperature: float = 0.0
+    response_format: str = "segments"
+    timestamp_granularities: Optional[Sequence[str]] = None
+    max_segment_length: Optional[float] = None
+    min_segment_length: Optional[float] = None
+    speaker_detection: bool = False
+    word_timestamps: bool = True
+    punctuation: bool = True
+    profanity_filter: bool = False
+    
+    def __post_init__(self):
+        # A tuple keeps the options hashable and truly read-only
+        granularities = self.timestamp_granularities
+        object.__setattr__(
+            self,
+            'timestamp_granularities',
+            ("segment",) if granularities is None else tuple(granularities),
+        )
 
 
 class TranscriptionService(ABC):
@@ -271,21 +412,71 @@ class TranscriptionService(ABC):
         """
         pass
     
-    def validate_audio_file(self, audio_file_path: Path) -> bool:
+    @cached_property
+    def _supported_extensions(self) -> FrozenSet[str]:
+        """Lower-cased supported extensions, built once per service instance."""
+        return frozenset(ext.lower() for ext in self.get_supported_formats())
+    
+    def validate_audio_file(self, audio_file_path: Path, check_exists: bool = True) -> bool:
         """
         Validate that audio file can be transcribed.
         
         Args:
             audio_file_path: Path to audio file
+            check_exists: Whether to check the file exists; pass False when
+                the caller already knows it does (e.g. from a directory listing)
             
         Returns:
             True if file is valid for transcription
         """
-        if not audio_file_path.exists():
+        # Check the extension first so unsupported files never hit the filesystem
+        if audio_file_path.suffix.lower() not in self._supported_extensions:
             return False
         
-        extension = audio_file_path.suffix.lower()
-        return extension in self.get_supported_formats()
+        return not check_exists or audio_file_path.exists()
+    
+    def is_thread_safe(self) -> bool:
+        """
+        Check if transcribe() may be called from several threads at once.
+        
+        Remote API services are usually safe to share; adapters running a
+        local model should return False.
+        
+        Returns:
+            True if transcribe_batch may use a thread pool
+        """
+        return True
+    
+    def transcribe_batch(
+        self,
+        audio_file_paths: Sequence[Path],
+        options: Optional[TranscriptionOptions] = None,
+        max_workers: Optional[int] = None
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe several audio files.
+        
+        Files are transcribed concurrently on a thread pool when the service
+        is thread safe, otherwise one after another. Adapters for local,
+        CPU-bound models can override this to use a process pool.
+        
+        Args:
+            audio_file_paths: Paths to audio files to transcribe
+            options: Optional transcription configuration applied to every file
+            max_workers: Maximum number of concurrent transcriptions
+            
+        Returns:
+            Transcription results in the same order as audio_file_paths
+            
+        Raises:
+            TranscriptionError: If any transcription fails
+        """
+        workers = max_workers or min(8, len(audio_file_paths))
+        if workers <= 1 or not self.is_thread_safe():
+            return [self.transcribe(path, options) for path in audio_file_paths]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda path: self.transcribe(path, options), audio_file_paths))
     
     def estimate_cost(
         self, 
@@ -316,9 +507,22 @@ class TranscriptionService(ABC):
 class TranscriptionError(Exception):
     """Exception raised when transcription fails."""
     
+    __slots__ = ('_details',)
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
-        self.details = details or {}
+        self._details = details or None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Extra error context; the dict is only allocated when first needed."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+    
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
 
 
 class UnsupportedFormatError(TranscriptionError):
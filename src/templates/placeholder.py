@@ -1,16 +1,28 @@
 """
 Placeholder classes and video template system for automated content generation.
 """
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
-import copy
+from array import array
+from typing import Callable, Dict, Any, Iterable, Optional, List, Tuple, Union
+from dataclasses import dataclass, field
 
+from .._compat import DATACLASS_SLOTS
 from ..core.timeline import Timeline
 from ..core.clips import Clip, VideoClip, AudioClip, ImageClip, TextClip, Position, Color
 from ..core.track import Track
 
 
+# Marks a key absent from template data, where None may be a real value
+_MISSING = object()
+
+
+def _media_path(source: Dict[str, Any]) -> Any:
+    """Get the media path from dict placeholder data; 'path' wins over the older 'file'."""
+    path = source.get('path')
+    return path if path else source.get('file')
+
+
 class Placeholder(ABC):
     """
     Abstract base class for template placeholders.
@@ -19,6 +31,8 @@ class Placeholder(ABC):
     that can be replaced with actual content when the template is filled.
     """
     
+    __slots__ = ('key', 'description', '_err_missing', '_err_missing_data')
+    
     def __init__(self, key: str, description: Optional[str] = None):
         """
         Initialize a placeholder.
@@ -27,8 +41,11 @@ class Placeholder(ABC):
             key: Unique key identifying this placeholder
             description: Human-readable description of the placeholder
         """
-        self.key = key
+        self.key = sys.intern(key)
         self.description = description
+        # Error messages are fixed per placeholder, so build them once
+        self._err_missing = f"Missing required placeholder: {self.key}"
+        self._err_missing_data = f"Missing required placeholder data: {self.key}"
     
     @abstractmethod
     def create_clip(self, data: Dict[str, Any]) -> Clip:
@@ -64,6 +81,11 @@ class PlaceholderVideo(Placeholder):
     Represents a video that will be provided when the template is filled.
     """
     
+    __slots__ = (
+        'start_time', 'duration', 'scale', 'position', 'required_duration',
+        'max_duration', 'allowed_formats', '_allowed_formats_tuple', '_err_invalid_format',
+    )
+    
     def __init__(
         self,
         key: str,
@@ -98,16 +120,21 @@ class PlaceholderVideo(Placeholder):
         self.required_duration = required_duration
         self.max_duration = max_duration
         self.allowed_formats = allowed_formats or ['.mp4', '.mov', '.avi', '.mkv']
+        # Lower-cased once for case-insensitive str.endswith checks
+        self._allowed_formats_tuple = tuple(fmt.lower() for fmt in self.allowed_formats)
+        self._err_invalid_format = (
+            f"Invalid format for {self.key}. Allowed: {', '.join(self.allowed_formats)}"
+        )
     
     def create_clip(self, data: Dict[str, Any]) -> VideoClip:
         """Create a video clip from template data."""
         if self.key not in data:
-            raise ValueError(f"Missing required placeholder data: {self.key}")
+            raise ValueError(self._err_missing_data)
         
         source_path = data[self.key]
         if isinstance(source_path, dict):
             # Handle complex data structure
-            path = source_path.get('path') or source_path.get('file')
+            path = _media_path(source_path)
             duration = source_path.get('duration', self.duration)
             start_time = source_path.get('start_time', self.start_time)
             scale = source_path.get('scale', self.scale)
@@ -119,7 +146,7 @@ class PlaceholderVideo(Placeholder):
             scale = self.scale
         
         return VideoClip(
-            source_path=str(path),
+            source_path=path if type(path) is str else str(path),
             start_time=start_time,
             duration=duration,
             scale=scale,
@@ -132,12 +159,12 @@ class PlaceholderVideo(Placeholder):
         errors = []
         
         if self.key not in data:
-            errors.append(f"Missing required placeholder: {self.key}")
+            errors.append(self._err_missing)
             return errors
         
         source_data = data[self.key]
         if isinstance(source_data, dict):
-            path = source_data.get('path') or source_data.get('file')
+            path = _media_path(source_data)
             duration = source_data.get('duration')
         else:
             path = source_data
@@ -146,13 +173,10 @@ class PlaceholderVideo(Placeholder):
         if not path:
             errors.append(f"Missing path for placeholder: {self.key}")
         else:
-            # Check file extension
+            # Check file extension, ignoring case
             path_str = str(path).lower()
-            if not any(path_str.endswith(fmt) for fmt in self.allowed_formats):
-                errors.append(
-                    f"Invalid format for {self.key}. "
-                    f"Allowed: {', '.join(self.allowed_formats)}"
-                )
+            if not path_str.endswith(self._allowed_formats_tuple):
+                errors.append(self._err_invalid_format)
         
         # Validate duration constraints
         if self.required_duration and duration != self.required_duration:
@@ -167,6 +191,8 @@ class PlaceholderVideo(Placeholder):
 class PlaceholderAudio(Placeholder):
     """Placeholder for audio clips."""
     
+    __slots__ = ('start_time', 'duration', 'volume')
+    
     def __init__(
         self,
         key: str,
@@ -183,11 +209,11 @@ class PlaceholderAudio(Placeholder):
     def create_clip(self, data: Dict[str, Any]) -> AudioClip:
         """Create an audio clip from template data."""
         if self.key not in data:
-            raise ValueError(f"Missing required placeholder data: {self.key}")
+            raise ValueError(self._err_missing_data)
         
         source_path = data[self.key]
         return AudioClip(
-            source_path=str(source_path),
+            source_path=source_path if type(source_path) is str else str(source_path),
             start_time=self.start_time,
             duration=self.duration,
             volume=self.volume,
@@ -198,13 +224,15 @@ class PlaceholderAudio(Placeholder):
         """Validate audio placeholder data."""
         errors = []
         if self.key not in data:
-            errors.append(f"Missing required placeholder: {self.key}")
+            errors.append(self._err_missing)
         return errors
 
 
 class PlaceholderImage(Placeholder):
     """Placeholder for image clips."""
     
+    __slots__ = ('duration', 'start_time', 'scale', 'position')
+    
     def __init__(
         self,
         key: str,
@@ -223,11 +251,11 @@ class PlaceholderImage(Placeholder):
     def create_clip(self, data: Dict[str, Any]) -> ImageClip:
         """Create an image clip from template data."""
         if self.key not in data:
-            raise ValueError(f"Missing required placeholder data: {self.key}")
+            raise ValueError(self._err_missing_data)
         
         source_path = data[self.key]
         return ImageClip(
-            source_path=str(source_path),
+            source_path=source_path if type(source_path) is str else str(source_path),
             duration=self.duration,
             start_time=self.start_time,
             scale=self.scale,
@@ -239,7 +267,7 @@ class PlaceholderImage(Placeholder):
         """Validate image placeholder data."""
         errors = []
         if self.key not in data:
-            errors.append(f"Missing required placeholder: {self.key}")
+            errors.append(self._err_missing)
         return errors
 
 
@@ -250,6 +278,11 @@ class PlaceholderText(Placeholder):
     Represents text that will be provided when the template is filled.
     """
     
+    __slots__ = (
+        'duration', 'start_time', 'font_size', 'font_family', 'color',
+        'position', 'max_length', 'required',
+    )
+    
     def __init__(
         self,
         key: str,
@@ -290,29 +323,26 @@ class PlaceholderText(Placeholder):
     
     def create_clip(self, data: Dict[str, Any]) -> TextClip:
         """Create a text clip from template data."""
-        if self.key not in data:
+        font_size = self.font_size
+        font_family = self.font_family
+        color = self.color
+        
+        text_data = data.get(self.key, _MISSING)
+        if text_data is _MISSING:
             if self.required:
-                raise ValueError(f"Missing required placeholder data: {self.key}")
+                raise ValueError(self._err_missing_data)
             text = ""  # Use empty text for optional placeholders
+        elif type(text_data) is str:
+            text = text_data  # Common case: plain text with the placeholder's styling
+        elif isinstance(text_data, dict):
+            text = text_data.get('text', '')
+            font_size = text_data.get('font_size', font_size)
+            font_family = text_data.get('font_family', font_family)
+            color_data = text_data.get('color')
+            if color_data and isinstance(color_data, dict):
+                color = Color(**color_data)
         else:
-            text_data = data[self.key]
-            if isinstance(text_data, dict):
-                text = text_data.get('text', '')
-                font_size = text_data.get('font_size', self.font_size)
-                font_family = text_data.get('font_family', self.font_family)
-                color_data = text_data.get('color')
-                if color_data:
-                    if isinstance(color_data, dict):
-                        color = Color(**color_data)
-                    else:
-                        color = self.color
-                else:
-                    color = self.color
-            else:
-                text = str(text_data)
-                font_size = self.font_size
-                font_family = self.font_family
-                color = self.color
+            text = str(text_data)
         
         return TextClip(
             text=text,
@@ -331,7 +361,7 @@ class PlaceholderText(Placeholder):
         
         if self.key not in data:
             if self.required:
-                errors.append(f"Missing required placeholder: {self.key}")
+                errors.append(self._err_missing)
             return errors
         
         text_data = data[self.key]
@@ -346,7 +376,7 @@ class PlaceholderText(Placeholder):
         return errors
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TemplateInfo:
     """Information about a video template."""
     name: str
@@ -357,9 +387,92 @@ class TemplateInfo:
     duration: Optional[float] = None
     resolution: Optional[tuple] = None
     
+    # Case-folded copies for TemplateLibrary searches, refreshed when the
+    # template is added to a library
+    _name_cf: str = field(default="", init=False, repr=False, compare=False)
+    _tags_cf: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _description_cf: str = field(default="", init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+        self._refresh_search_fields()
+    
+    def _refresh_search_fields(self) -> None:
+        """Recompute the case-folded search fields from the current values."""
+        self._name_cf = self.name.casefold()
+        self._tags_cf = tuple(tag.casefold() for tag in self.tags)
+        self._description_cf = self.description.casefold()
+
+
+class _PlaceholderTable:
+    """
+    Template placeholders stored as parallel arrays.
+    
+    Row i holds keys[i], placeholders[i] and the placeholder's position
+    (track_indices[i], clip_indices[i]); index maps each key to its row.
+    Rows stay in insertion order. The placeholders' validate_data and
+    create_clip methods are bound once per row so fill loops call them
+    without a method lookup.
+    """
+    
+    __slots__ = (
+        'keys', 'placeholders', 'validators', 'creators',
+        'track_indices', 'clip_indices', 'index',
+    )
+    
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+        self.placeholders: List[Placeholder] = []
+        self.validators: List[Callable[[Dict[str, Any]], List[str]]] = []
+        self.creators: List[Callable[[Dict[str, Any]], Clip]] = []
+        self.track_indices = array('i')
+        self.clip_indices = array('i')
+        self.index: Dict[str, int] = {}
+    
+    def get(self, key: str) -> Optional[Placeholder]:
+        """Get the placeholder for a key, or None."""
+        row = self.index.get(key)
+        return None if row is None else self.placeholders[row]
+    
+    def put(self, placeholder: Placeholder, track_index: int, clip_index: int) -> None:
+        """Add a placeholder, replacing any existing one with the same key in place."""
+        key = placeholder.key
+        row = self.index.get(key)
+        if row is None:
+            self.index[key] = len(self.keys)
+            self.keys.append(key)
+            self.placeholders.append(placeholder)
+            self.validators.append(placeholder.validate_data)
+            self.creators.append(placeholder.create_clip)
+            self.track_indices.append(track_index)
+            self.clip_indices.append(clip_index)
+        else:
+            self.placeholders[row] = placeholder
+            self.validators[row] = placeholder.validate_data
+            self.creators[row] = placeholder.create_clip
+            self.track_indices[row] = track_index
+            self.clip_indices[row] = clip_index
+    
+    def remove(self, key: str) -> bool:
+        """Remove the placeholder for a key; returns whether it was present."""
+        row = self.index.pop(key, None)
+        if row is None:
+            return False
+        
+        del self.keys[row]
+        del self.placeholders[row]
+        del self.validators[row]
+        del self.creators[row]
+        del self.track_indices[row]
+        del self.clip_indices[row]
+        for i in range(row, len(self.keys)):
+            self.index[self.keys[i]] = i
+        return True
+    
+    def __len__(self) -> int:
+        """Return the number of placeholders."""
+        return len(self.keys)
 
 
 class VideoTemplate:
@@ -385,8 +498,9 @@ class VideoTemplate:
         """
         self.timeline = timeline
         self.info = info or TemplateInfo("Untitled Template", "No description")
-        self._placeholders: Dict[str, Placeholder] = {}
-        self._placeholder_positions: Dict[str, tuple] = {}  # (track_index, clip_index)
+        self._placeholders = _PlaceholderTable()
+        # Derived from the placeholders; reset by add_placeholder/remove_placeholder
+        self._required_keys: Optional[Tuple[str, ...]] = None
         
         # Scan timeline for existing placeholders
         self._scan_for_placeholders()
@@ -408,21 +522,18 @@ class VideoTemplate:
         Returns:
             Self for method chaining
         """
-        self._placeholders[placeholder.key] = placeholder
-        
         # Add to timeline
         if clip_index is None:
-            clip_index = len(self.timeline.get_track(track_index).clips)
+            clip_index = len(self.timeline.get_track(track_index))
         
-        self._placeholder_positions[placeholder.key] = (track_index, clip_index)
+        self._placeholders.put(placeholder, track_index, clip_index)
+        self._required_keys = None
         return self
     
     def remove_placeholder(self, key: str) -> 'VideoTemplate':
         """Remove a placeholder from the template."""
-        if key in self._placeholders:
-            del self._placeholders[key]
-            if key in self._placeholder_positions:
-                del self._placeholder_positions[key]
+        if self._placeholders.remove(key):
+            self._required_keys = None
         return self
     
     def get_placeholder(self, key: str) -> Optional[Placeholder]:
@@ -431,14 +542,16 @@ class VideoTemplate:
     
     def list_placeholders(self) -> List[str]:
         """Get list of all placeholder keys."""
-        return list(self._placeholders.keys())
+        return list(self._placeholders.keys)
     
-    def fill(self, data: Dict[str, Any]) -> Timeline:
+    def fill(self, data: Dict[str, Any], collect_all_errors: bool = False) -> Timeline:
         """
         Fill the template with data to create a concrete timeline.
         
         Args:
             data: Dictionary mapping placeholder keys to their values
+            collect_all_errors: Validate every placeholder and report all errors
+                together, instead of stopping at the first invalid placeholder
             
         Returns:
             New timeline with placeholders replaced by actual content
@@ -446,32 +559,92 @@ class VideoTemplate:
         Raises:
             ValueError: If required placeholders are missing or invalid
         """
-        # Validate all placeholders
-        all_errors = []
-        for placeholder in self._placeholders.values():
-            errors = placeholder.validate_data(data)
-            all_errors.extend(errors)
+        return self.compile()(data, collect_all_errors)
+    
+    def fill_many(
+        self,
+        data_list: Iterable[Dict[str, Any]],
+        collect_all_errors: bool = False
+    ) -> List[Timeline]:
+        """
+        Fill the template once per data set.
+        
+        The template layout is compiled once for the whole batch, so only the
+        per-item work (validation, clip creation, and the timeline copy) is
+        repeated.
         
-        if all_errors:
-            raise ValueError(f"Template validation failed: {'; '.join(all_errors)}")
+        Args:
+            data_list: Data dictionaries, one per timeline to create
+            collect_all_errors: Report all validation errors of a failing item
+            
+        Returns:
+            Filled timelines in the same order as data_list
+            
+        Raises:
+            ValueError: If any item's placeholders are missing or invalid
+        """
+        fill = self.compile()
+        return [fill(data, collect_all_errors) for data in data_list]
+    
+    def compile(self) -> Callable[..., Timeline]:
+        """
+        Prepare a fill function for the template's current layout.
         
-        # Create a deep copy of the timeline
-        filled_timeline = copy.deepcopy(self.timeline)
+        The placeholders and the timeline positions they replace are resolved
+        once, so the returned function only validates, builds clips, and copies
+        the timeline. Compile again after adding or removing placeholders or
+        adding or removing clips and tracks on the template timeline.
         
-        # Replace placeholders with actual clips
-        for key, placeholder in self._placeholders.items():
-            if key in self._placeholder_positions:
-                track_index, clip_index = self._placeholder_positions[key]
-                
-                # Create the actual clip
-                actual_clip = placeholder.create_clip(data)
+        Returns:
+            Function taking (data, collect_all_errors=False) that behaves like fill
+        """
+        table = self._placeholders
+        rows = []
+        skip: Dict[int, set] = {}
+        for validate, create, track_index, clip_index in zip(
+            table.validators, table.creators, table.track_indices, table.clip_indices
+        ):
+            # Only placeholder slots that exist in the timeline get replaced
+            clip_index = self._resolve_slot(track_index, clip_index)
+            if clip_index is not None:
+                skip.setdefault(track_index, set()).add(clip_index)
+            rows.append((validate, create, track_index, clip_index))
+        
+        rows = tuple(rows)
+        timeline = self.timeline
+        
+        def fill(data: Dict[str, Any], collect_all_errors: bool = False) -> Timeline:
+            if collect_all_errors:
+                all_errors = [error for row in rows for error in row[0](data)]
+                if all_errors:
+                    raise ValueError(f"Template validation failed: {'; '.join(all_errors)}")
+            
+            # Validate and build clips in one pass, before paying for the timeline copy
+            # track index -> {clip index: new clip}
+            replacements: Dict[int, Dict[int, Clip]] = {}
+            for validate, create, track_index, clip_index in rows:
+                if not collect_all_errors:
+                    errors = validate(data)
+                    if errors:
+                        raise ValueError(f"Template validation failed: {'; '.join(errors)}")
                 
-                # Replace the placeholder in the timeline
-                track = filled_timeline.get_track(track_index)
-                if track and clip_index < len(track.clips):
-                    track._clips[clip_index] = actual_clip
+                actual_clip = create(data)
+                if clip_index is not None:
+                    replacements.setdefault(track_index, {})[clip_index] = actual_clip
+            
+            # Copy the timeline without copying the clips about to be replaced
+            filled_timeline = timeline._clone_skeleton(skip)
+            
+            # Replace placeholders with actual clips, one track at a time
+            tracks = filled_timeline._tracks
+            for track_index, track_clips in replacements.items():
+                track = tracks[track_index]
+                for clip_index, actual_clip in track_clips.items():
+                    track.replace_clip(clip_index, actual_clip)
+            
+            return filled_timeline
         
-        return filled_timeline
+        return fill
     
     def validate_data(self, data: Dict[str, Any]) -> List[str]:
         """
@@ -484,19 +657,20 @@ class VideoTemplate:
             List of validation error messages (empty if valid)
         """
         all_errors = []
-        for placeholder in self._placeholders.values():
-            errors = placeholder.validate_data(data)
-            all_errors.extend(errors)
+        for validate in self._placeholders.validators:
+            all_errors.extend(validate(data))
         return all_errors
     
     def get_required_data_keys(self) -> List[str]:
         """Get list of required data keys for this template."""
-        required_keys = []
-        for key, placeholder in self._placeholders.items():
-            if isinstance(placeholder, PlaceholderText) and not placeholder.required:
-                continue  # Skip optional text placeholders
-            required_keys.append(key)
-        return required_keys
+        if self._required_keys is None:
+            table = self._placeholders
+            self._required_keys = tuple(
+                key for key, placeholder in zip(table.keys, table.placeholders)
+                # Skip optional text placeholders
+                if not (isinstance(placeholder, PlaceholderText) and not placeholder.required)
+            )
+        return list(self._required_keys)
     
     def get_template_info(self) -> Dict[str, Any]:
         """Get template information as dictionary."""
@@ -512,6 +686,13 @@ class VideoTemplate:
             'required_keys': self.get_required_data_keys(),
         }
     
+    def _resolve_slot(self, track_index: int, clip_index: int) -> Optional[int]:
+        """Get the non-negative clip index of a placeholder position, or None if it is empty."""
+        track = self.timeline.get_track(track_index)
+        if track is None or not -len(track) <= clip_index < len(track):
+            return None
+        return clip_index % len(track)
+    
     def _scan_for_placeholders(self) -> None:
         """Scan the timeline for existing placeholder clips."""
         # This would be implemented to detect special placeholder clips
@@ -575,6 +756,8 @@ class TemplateLibrary:
         """Add a template to the library."""
         name = template.info.name
         self._templates[name] = template
+        # Pick up any edits made to the info since it was created
+        template.info._refresh_search_fields()
         
         if category not in self._categories:
             self._categories[category] = []
@@ -598,22 +781,23 @@ class TemplateLibrary:
         search_description: bool = True
     ) -> List[str]:
         """Search templates by name, tags, or description."""
-        query_lower = query.lower()
+        query_folded = query.casefold()
         matches = []
         
         for name, template in self._templates.items():
+            info = template.info
             # Search name
-            if query_lower in name.lower():
+            if query_folded in info._name_cf:
                 matches.append(name)
                 continue
             
             # Search tags
-            if search_tags and any(query_lower in tag.lower() for tag in template.info.tags):
+            if search_tags and any(query_folded in tag for tag in info._tags_cf):
                 matches.append(name)
                 continue
             
             # Search description
-            if search_description and query_lower in template.info.description.lower():
+            if search_description and query_folded in info._description_cf:
                 matches.append(name)
         
         return matches
@@ -1,13 +1,97 @@
 """
 Tests for core domain functionality.
 """
+import copy
+import io
+
 import pytest
 from pathlib import Path
 
 from aive.core.timeline import Timeline
 from aive.core.track import Track, TrackType
 from aive.core.clips import VideoClip, AudioClip, ImageClip, TextClip, Color, Position
-from aive.core.transitions import CrossfadeTransition, WipeTransition, WipeDirection
+from aive.core.transitions import (
+    Transition, CrossfadeTransition, WipeTransition, WipeDirection, TransitionType
+)
+from aive.ports.transcription_service import (
+    SubtitleSegment, TranscriptionResult, TranscriptionOptions, TranscriptionError,
+    TranscriptionService
+)
+from aive.ports.timeline_format import (
+    TimelineFormat, SupportedFormat, FormatCapability, ImportOptions
+)
+from aive.pipeline.render_queue import RenderJob, RenderQueue, QueueMode, JobStatus, JobProgressCallback
+from aive.ports.renderer import Renderer, RenderError, RenderOptions
+from aive.templates.placeholder import (
+    VideoTemplate, PlaceholderText, PlaceholderVideo, TemplateInfo, TemplateLibrary
+)
+
+
+class DummyRenderer(Renderer):
+    """Renderer that records output paths instead of writing files."""
+    
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.rendered = []
+    
+    def render(self, timeline, output_path, options=None):
+        if self.fail_on and self.fail_on in str(output_path):
+            raise RenderError("Simulated failure")
+        self.rendered.append(str(output_path))
+    
+    def can_render(self, timeline):
+        return True
+    
+    def get_supported_formats(self):
+        return ["mp4"]
+    
+    def estimate_render_time(self, timeline, options=None):
+        return 0.0
+
+
+class DummyFormat(TimelineFormat):
+    """Timeline format with configurable formats and capabilities."""
+    
+    def __init__(self, formats, capability=None):
+        self.formats = formats
+        self.capability = capability or FormatCapability()
+    
+    def read(self, file_path, options=None):
+        return Timeline()
+    
+    def write(self, timeline, file_path, options=None):
+        pass
+    
+    def can_read(self, file_path):
+        return True
+    
+    def can_write(self, timeline):
+        return True
+    
+    def get_supported_formats(self):
+        return list(self.formats)
+    
+    def get_format_capabilities(self, format_type):
+        return self.capability
+
+
+class SampleCheckRenderer(DummyRenderer):
+    """Renderer that fails unless the first clip's samples add up."""
+    
+    def render(self, timeline, output_path, options=None):
+        samples = timeline.tracks[0].clips[0].get_property("samples")
+        if samples.sum() != samples.size:
+            raise RenderError("Samples corrupted in transit")
+
+
+class SlottedRenderOptions(RenderOptions):
+    """Options subclass that declares its own slots."""
+    
+    __slots__ = ('extra',)
+
+
+class PlainRenderOptions(RenderOptions):
+    """Options subclass that keeps extra attributes in a __dict__."""
 
 
 class TestTimeline:
@@ -43,6 +127,19 @@ class TestTimeline:
         assert vertical_timeline.width == 1080
         assert vertical_timeline.height == 1920
     
+    def test_timeline_presets_are_independent(self):
+        """Test that preset timelines do not share tracks or properties."""
+        first = Timeline.create_standard_hd("First")
+        second = Timeline.create_standard_hd("Second")
+        
+        first.add_clip(TextClip("Only here", duration=2.0))
+        first.set_property("owner", "first")
+        
+        assert len(first) == 1
+        assert len(second) == 0
+        assert second.name == "Second"
+        assert second.get_property("owner") is None
+    
     def test_add_tracks(self):
         """Test adding tracks to timeline."""
         timeline = Timeline()
@@ -70,6 +167,65 @@ class TestTimeline:
         track.add_clip(clip2)
         
         assert timeline.duration == 10.0
+        
+        # Cached durations follow clip edits and removals
+        clip2.duration = 5.0
+        assert timeline.duration == 12.0
+        track.remove_clip(clip2)
+        assert timeline.duration == 5.0
+        
+        # Clips with unknown duration do not extend the timeline
+        track.add_clip(VideoClip("video.mp4", start_time=50.0))
+        assert timeline.duration == 5.0
+    
+    def test_active_clip_mask(self):
+        """Test per-frame clip activity across tracks."""
+        np = pytest.importorskip("numpy")
+        timeline = Timeline()
+        first = timeline.add_track()
+        second = timeline.add_track()
+        first.add_clip(TextClip("A", duration=2.0)).add_clip(TextClip("B", duration=2.0, start_time=1.0))
+        second.add_clip(TextClip("C", duration=1.0, start_time=2.5))
+        
+        times = np.arange(0.0, 4.0, 0.5)
+        mask = timeline.active_clip_mask(times)
+        assert mask.shape == (len(times), 3)
+        for f, time in enumerate(times):
+            for i, clip in enumerate(timeline.get_all_clips()):
+                assert mask[f, i] == (clip.start_time <= time < clip.end_time)
+        assert (first.active_clip_mask(times) == mask[:, :2]).all()
+        
+        second.set_enabled(False)
+        assert not timeline.active_clip_mask(times)[:, 2].any()
+    
+    def test_remove_tracks(self):
+        """Test removing tracks by index and by instance."""
+        timeline = Timeline()
+        first = timeline.add_track()
+        second = timeline.add_track()
+        third = timeline.add_track()
+        
+        timeline.remove_track_at(1)
+        assert timeline.tracks == [first, third]
+        
+        timeline.remove_track_instance(first).remove_track(second).remove_track(5)
+        assert timeline.tracks == [third]
+    
+    def test_timeline_properties(self):
+        """Test custom properties on timelines and tracks."""
+        timeline = Timeline()
+        track = timeline.add_track()
+        
+        assert timeline.get_property("missing", "default") == "default"
+        assert track.get_property("missing") is None
+        assert timeline.to_dict()["properties"] == {}
+        
+        timeline.set_property("project", "demo")
+        track.set_property("role", "titles")
+        
+        assert timeline.get_property("project") == "demo"
+        assert track.get_property("role") == "titles"
+        assert timeline.to_dict()["properties"] == {"project": "demo"}
 
 
 class TestTrack:
@@ -117,6 +273,64 @@ class TestTrack:
         
         with pytest.raises(ValueError):
             audio_track.add_clip(video_clip)  # Video clip on audio track
+        
+        # Non-raising variants
+        assert not audio_track.try_add_clip(text_clip)
+        assert audio_track.try_add_clip(AudioClip("other.wav", duration=1.0), 0)
+        assert len(audio_track) == 2
+        assert Track(TrackType.COMPOSITE).accepts_clip(audio_clip)
+    
+    def test_remove_clips(self):
+        """Test removing clips by index and by instance."""
+        track = Track()
+        clips = [TextClip(f"Clip {i}", duration=1.0, start_time=float(i)) for i in range(4)]
+        for clip in clips:
+            track.add_clip(clip)
+        
+        track.remove_clip_at(0).remove_clip_at(10)
+        assert track.clips == clips[1:]
+        
+        track.remove_clip_instance(clips[2]).remove_clip_instance(clips[0])
+        assert track.clips == [clips[1], clips[3]]
+        
+        track.remove_clip(clips[3]).remove_clip(0)
+        assert len(track) == 0
+    
+    def test_bulk_edit(self):
+        """Test that edits inside a bulk edit behave like individual edits."""
+        timeline = Timeline()
+        track = timeline.add_track()
+        clips = [TextClip(f"Clip {i}", duration=1.0, start_time=float(i)) for i in range(5)]
+        
+        with timeline.bulk_edit():
+            for clip in clips:
+                track.insert_clip(clip, 0)
+            track.remove_clip(clips[2])
+            clips[0].start_time = 10.0
+            assert track.find_clips_at_time(10.5) == [clips[0]]
+        
+        assert track.clips == [clips[4], clips[3], clips[1], clips[0]]
+        assert [clip._pos for clip in track] == [0, 1, 2, 3]
+        
+        track.remove_clip(clips[1])
+        assert track.clips == [clips[4], clips[3], clips[0]]
+    
+    def test_copy_and_pickle_rebind_clips(self):
+        """Test that copied and unpickled tracks keep their clips bound."""
+        import pickle
+        
+        track = Track(TrackType.VIDEO)
+        track.add_clip(VideoClip("video1.mp4", duration=5.0))
+        track.add_clip(VideoClip("video2.mp4", duration=3.0, start_time=5.0))
+        assert not hasattr(track.clips[0], '__dict__')
+        
+        for restored in (copy.deepcopy(track), pickle.loads(pickle.dumps(track))):
+            assert [clip.source_path for clip in restored] == [Path("video1.mp4"), Path("video2.mp4")]
+            assert [clip._pos for clip in restored] == [0, 1]
+            assert restored.find_clips_at_time(6.0) == [restored.clips[1]]
+            restored.clips[1].start_time = 10.0
+            assert restored.duration == 13.0
+        assert track.duration == 8.0
     
     def test_transitions(self):
         """Test adding transitions between clips."""
@@ -163,6 +377,157 @@ class TestTrack:
         
         clips_at_15 = track.find_clips_at_time(15.0)  # No clips
         assert len(clips_at_15) == 0
+    
+    def test_find_clips_at_time_large_track(self):
+        """Test time queries on a track large enough to use the vectorized path."""
+        track = Track()
+        clips = [
+            TextClip(f"Clip {i}", duration=1.5, start_time=i * 0.5)
+            for i in range(200)
+        ]
+        for clip in clips:
+            track.add_clip(clip)
+        
+        for time in (0.0, 10.25, 99.75, 150.0):
+            expected = [c for c in clips if c.start_time <= time < c.end_time]
+            assert track.find_clips_at_time(time) == expected
+        
+        assert len(track.find_clips_at_time(10.25)) == 3
+    
+    def test_find_clips_at_time_indexed(self, monkeypatch):
+        """Test time queries through the interval index follow clip edits."""
+        monkeypatch.setattr("aive.core.track.INDEX_THRESHOLD", 8)
+        track = Track()
+        clips = [
+            TextClip(f"Clip {i}", duration=1.5, start_time=(i * 7) % 40 * 0.5)
+            for i in range(40)
+        ]
+        background = TextClip("Background", duration=25.0)
+        for clip in clips + [background]:
+            track.add_clip(clip)
+        
+        for _ in range(2):
+            for time in (0.0, 4.25, 10.0, 19.9, 30.0):
+                expected = [c for c in track.clips if c.start_time <= time < c.end_time]
+                assert track.find_clips_at_time(time) == expected
+        
+        background.duration = 5.0
+        assert background not in track.find_clips_at_time(10.0)
+    
+    def test_find_clips_at_time_sorted_track(self):
+        """Test repeated time queries on clips laid out in time order."""
+        track = Track()
+        clips = [TextClip(f"Clip {i}", duration=1.0, start_time=float(i)) for i in range(20)]
+        background = TextClip("Background", duration=12.0, start_time=0.5)
+        track.add_clip(clips[0])
+        track.add_clip(background)
+        for clip in clips[1:]:
+            track.add_clip(clip)
+        
+        for _ in range(2):
+            for time in (0.0, 0.5, 3.0, 12.4, 12.5, 19.99, 20.0):
+                expected = [c for c in track.clips if c.start_time <= time < c.end_time]
+                assert track.find_clips_at_time(time) == expected
+        
+        clips[1].start_time = 30.0  # No longer in time order
+        for _ in range(2):
+            assert track.find_clips_at_time(30.5) == [clips[1]]
+            assert track.find_clips_at_time(1.5) == [background]
+    
+    def test_find_clips_after_timing_changes(self):
+        """Test that time queries follow clip edits, removals, and sorting."""
+        track = Track()
+        
+        clip1 = TextClip("First", duration=2.0, start_time=6.0)   # 6-8
+        clip2 = TextClip("Second", duration=2.0, start_time=0.0)  # 0-2
+        clip3 = TextClip("Third", duration=2.0, start_time=3.0)   # 3-5
+        
+        track.add_clip(clip1).add_clip(clip2).insert_clip(clip3, 1)
+        assert track.find_clips_at_time(3.5) == [clip3]
+        
+        # Moving a clip after it was added is picked up by queries
+        clip2.start_time = 10.0
+        assert track.find_clips_at_time(1.0) == []
+        assert track.find_clips_at_time(11.0) == [clip2]
+        
+        clip3.duration = 10.0  # 3-13
+        assert track.find_clips_at_time(11.0) == [clip3, clip2]
+        
+        track.sort_clips_by_time()
+        assert track.clips == [clip3, clip1, clip2]
+        assert track.find_clips_at_time(7.0) == [clip3, clip1]
+        
+        track.remove_clip(clip3)
+        assert track.find_clips_at_time(7.0) == [clip1]
+        
+        # Removed clips no longer update the track
+        clip3.start_time = 7.0
+        assert track.find_clips_at_time(7.0) == [clip1]
+    
+    def test_copied_track_tracks_its_own_clips(self):
+        """Test that a deep-copied track follows edits to its own clips only."""
+        track = Track()
+        clip = TextClip("Original", duration=2.0)
+        track.add_clip(TextClip("Other", duration=1.0, start_time=5.0)).add_clip(clip)
+        
+        copied = copy.deepcopy(track)
+        copied_clip = copied[1]
+        copied_clip.start_time = 20.0
+        
+        assert track.find_clips_at_time(1.0) == [clip]
+        assert copied.find_clips_at_time(21.0) == [copied_clip]
+        
+        copied.remove_clip(copied_clip)
+        assert len(copied) == 1
+        assert len(track) == 2
+    
+    def test_clip_already_on_a_track(self):
+        """Test that a clip can only be on one track at a time."""
+        first = Track()
+        second = Track()
+        clip = TextClip("Shared", duration=5.0)
+        first.add_clip(clip)
+        
+        # Neither another track nor the same track can take it again
+        with pytest.raises(ValueError):
+            second.add_clip(clip)
+        with pytest.raises(ValueError):
+            first.add_clip(clip)
+        with pytest.raises(ValueError):
+            second.add_clip(TextClip("Other", duration=1.0)).replace_clip(0, clip)
+        
+        assert first.clips == [clip]
+        clip.start_time = 10.0
+        assert first.find_clips_at_time(11.0) == [clip]
+        assert second.find_clips_at_time(11.0) == []
+        
+        # Once removed, the clip can move to another track
+        first.remove_clip(clip)
+        second.add_clip(clip)
+        clip.start_time = 3.0
+        assert second.find_clips_at_time(4.0) == [clip]
+        assert first.find_clips_at_time(4.0) == []
+        
+        # Replacing a clip with itself keeps it in place
+        second.replace_clip(1, clip)
+        assert second.clips[1] is clip
+    
+    def test_replace_clip(self):
+        """Test replacing a clip in place."""
+        track = Track(TrackType.TEXT)
+        
+        old_clip = TextClip("Old", duration=5.0)
+        new_clip = TextClip("New", duration=2.0, start_time=10.0)
+        track.add_clip(old_clip)
+        
+        track.replace_clip(0, new_clip)
+        
+        assert track.clips == [new_clip]
+        assert track.find_clips_at_time(1.0) == []
+        assert track.find_clips_at_time(11.0) == [new_clip]
+        
+        with pytest.raises(ValueError):
+            track.replace_clip(0, AudioClip("test.wav", duration=1.0))
 
 
 class TestClips:
@@ -203,6 +568,44 @@ class TestClips:
         assert clip.bold is True
         assert clip.italic is True
         assert clip.alignment == "center"
+        
+        assert clip.configure(italic=False, underline=True, alignment="right") is clip
+        assert (clip.bold, clip.italic, clip.underline, clip.alignment) == (True, False, True, "right")
+        with pytest.raises(ValueError):
+            clip.configure(alignment="middle")
+    
+    def test_text_clip_batch_create(self):
+        """Test that batch-created text clips match individually built ones."""
+        from aive.core._slots import get_slot_state
+        
+        color = Color(10, 20, 30)
+        clips = TextClip.batch_create(["a", "b"], [0.0, 1.5], [1.5, 2.0], font_size=32, color=color)
+        expected = [
+            TextClip("a", 1.5, 0.0, font_size=32, color=color),
+            TextClip("b", 2.0, 1.5, font_size=32, color=color),
+        ]
+        assert [get_slot_state(clip) for clip in clips] == [get_slot_state(clip) for clip in expected]
+        assert clips[1].end_time == 3.5
+        
+        with pytest.raises(ValueError):
+            TextClip.batch_create(["a"], [0.0, 1.0], [1.0])
+    
+    def test_clip_pool(self):
+        """Test that released clips are reused fully reinitialized."""
+        track = Track()
+        clip = TextClip.acquire("First", duration=3.0)
+        track.add_clip(clip)
+        clip.set_bold().set_property("speaker", "A")
+        with pytest.raises(ValueError):
+            clip.release()
+        
+        track.remove_clip(clip)
+        clip.release()
+        reused = TextClip.acquire("Second", 2.0, start_time=1.0)
+        assert reused is clip
+        assert (reused.text, reused.end_time, reused.bold) == ("Second", 3.0, False)
+        assert reused.get_property("speaker") is None
+        assert TextClip.acquire("Third", 1.0) is not clip
     
     def test_video_clip_creation(self):
         """Test VideoClip creation."""
@@ -312,6 +715,9 @@ class TestTransitions:
         # Invalid curve should raise error
         with pytest.raises(ValueError):
             CrossfadeTransition(1.0, curve="invalid_curve")
+        
+        assert CrossfadeTransition.validate_curve("ease_in")
+        assert not CrossfadeTransition.validate_curve("invalid_curve")
     
     def test_wipe_transition(self):
         """Test WipeTransition creation."""
@@ -330,6 +736,16 @@ class TestTransitions:
         params = transition.get_parameters()
         assert params["direction"] == "right_to_left"
         assert params["feather"] == 0.3
+        
+        # Cached read-only view, rebuilt after any change
+        assert transition.get_parameters() is params
+        with pytest.raises(TypeError):
+            params["feather"] = 1.0
+        transition.set_feather(0.6)
+        assert transition.get_parameters()["feather"] == 0.6
+        transition.duration = 2.0
+        assert transition.get_parameters()["duration"] == 2.0
+        assert copy.deepcopy(transition).get_parameters() == transition.get_parameters()
     
     def test_wipe_transition_methods(self):
         """Test WipeTransition chainable methods."""
@@ -341,6 +757,48 @@ class TestTransitions:
         assert transition.direction == WipeDirection.TOP_TO_BOTTOM
         assert transition.feather == 0.8  # Should be clamped to max 1.0
     
+    def test_transition_enum_codes(self):
+        """Test integer dispatch codes alongside string values."""
+        assert WipeDirection.LEFT_TO_RIGHT.code == 0
+        assert WipeDirection.BOTTOM_TO_TOP.code == 3
+        assert TransitionType.CROSSFADE.code == 0
+        assert WipeTransition(1.0).get_type().code == TransitionType.WIPE.code
+        
+        # Serialized values stay strings
+        assert WipeDirection.RIGHT_TO_LEFT.value == "right_to_left"
+        assert len({t.code for t in TransitionType}) == len(TransitionType)
+    
+    def test_minimal_transition_subclass(self):
+        """Test that subclasses only need get_type and get_parameters."""
+        class Dissolve(Transition):
+            parameter_fields = ("duration",)
+            
+            def get_type(self):
+                return TransitionType.DISSOLVE
+            
+            def get_parameters(self):
+                return {"duration": self.duration}
+        
+        dissolve = Dissolve(0.5)
+        assert dissolve.get_parameters() == {"duration": 0.5}
+        assert dissolve.get_parameters_tuple() == (0.5,)
+        
+        # Leaving out the parameters fails when the class is defined
+        with pytest.raises(TypeError):
+            class Broken(Transition):
+                def get_type(self):
+                    return TransitionType.DISSOLVE
+    
+    def test_transition_parameter_tuples(self):
+        """Test positional parameters with integer codes."""
+        crossfade = CrossfadeTransition(1.0, curve="ease_out")
+        assert crossfade.get_parameters_tuple() == (1.0, 2)
+        assert crossfade.curve_code == 2
+        
+        wipe = WipeTransition(0.5, WipeDirection.TOP_TO_BOTTOM, feather=0.25)
+        params = dict(zip(wipe.parameter_fields, wipe.get_parameters_tuple()))
+        assert params == {"duration": 0.5, "direction_code": 2, "feather": 0.25}
+    
     def test_transition_feather_clamping(self):
         """Test that feather values are clamped to 0.0-1.0 range."""
         # Test constructor clamping
@@ -376,6 +834,13 @@ class TestColor:
         hex_color = color.to_hex()
         
         assert hex_color == "#ff8040"
+        assert color.to_hex() is hex_color
+        assert color == Color(255, 128, 64)
+        assert repr(color) == "Color(r=255, g=128, b=64, a=255)"
+        
+        # Unvalidated channels outside 0-255 still format
+        assert Color(300, 0, 0).to_hex() == "#12c0000"
+        assert Color(-1, 0, 0).to_hex() == "#-10000"
     
     def test_color_defaults(self):
         """Test Color default values."""
@@ -393,3 +858,558 @@ class TestPosition:
         
         assert pos.x == 100.5
         assert pos.y == 200.7
+
+
+class TestTranscription:
+    """Tests for transcription result types."""
+    
+    def test_subtitle_time_formatting(self):
+        """Test SRT and VTT timestamps."""
+        segment = SubtitleSegment("Hello", start_time=3723.456, end_time=3725.0)
+        
+        assert segment.to_srt_format(1) == "1\n01:02:03,456 --> 01:02:05,000\nHello\n\n"
+        assert segment.to_vtt_format() == "01:02:03.456 --> 01:02:05.000\nHello\n\n"
+        assert segment.duration == pytest.approx(1.544)
+    
+    def test_subtitle_documents(self):
+        """Test full SRT and VTT documents."""
+        result = TranscriptionResult(
+            segments=[
+                SubtitleSegment("One", start_time=0.0, end_time=1.5),
+                SubtitleSegment("Two", start_time=1.5, end_time=3.0),
+            ],
+            language="en",
+            duration=3.0,
+        )
+        
+        assert result.to_srt() == (
+            "1\n00:00:00,000 --> 00:00:01,500\nOne\n\n"
+            "2\n00:00:01,500 --> 00:00:03,000\nTwo\n\n"
+        )
+        assert result.to_vtt().startswith("WEBVTT\n\n00:00:00.000 --> 00:00:01.500\nOne")
+        
+        assert result.full_text == "One Two"
+        assert result.full_text is result.full_text
+    
+    def test_segment_time_queries(self):
+        """Test point and range lookups over segments."""
+        long_segment = SubtitleSegment("Long", start_time=0.0, end_time=10.0)
+        result = TranscriptionResult(
+            segments=[
+                SubtitleSegment("C", start_time=4.0, end_time=5.0),
+                long_segment,
+                SubtitleSegment("A", start_time=1.0, end_time=2.0),
+                SubtitleSegment("B", start_time=2.0, end_time=3.0),
+            ],
+            language="en",
+            duration=10.0,
+        )
+        
+        assert [s.text for s in result.segments_at(2.0)] == ["Long", "B"]
+        assert [s.text for s in result.segments_at(3.5)] == ["Long"]
+        assert result.segments_at(10.0) == []
+        assert [s.text for s in result.segments_in(1.0, 4.0)] == ["A", "B", "C"]
+        
+        # Segments cannot be edited in place; assigning new ones resets lookups
+        assert isinstance(result.segments, tuple)
+        assert result.full_text == "C Long A B"
+        result.segments = [SubtitleSegment("D", start_time=20.0, end_time=21.0)]
+        assert isinstance(result.segments, tuple)
+        assert result.full_text == "D"
+        assert result.segments_at(2.0) == []
+        assert [s.text for s in result.segments_in(20.0, 21.0)] == ["D"]
+    
+    def test_groq_merge_keeps_known_confidence(self):
+        """Test merging keeps the lowest confidence that is known."""
+        from aive.adapters.groq_whisper_transcriber import GroqWhisperTranscriber
+        
+        transcriber = object.__new__(GroqWhisperTranscriber)
+        merged = transcriber._merge_short_segments([
+            SubtitleSegment("A", start_time=0.0, end_time=0.2, confidence=None),
+            SubtitleSegment("B", start_time=0.2, end_time=0.4, confidence=0.8),
+            SubtitleSegment("C", start_time=0.4, end_time=2.0, confidence=0.6),
+        ], min_duration=1.0)
+        
+        assert len(merged) == 1
+        assert merged[0].text == "A B C"
+        assert merged[0].confidence == 0.6
+    
+    def test_error_details(self):
+        """Test error details default to an empty dict on access."""
+        error = TranscriptionError("failed")
+        assert error._details is None
+        assert error.details == {}
+        
+        error = TranscriptionError("failed", {"status": 500})
+        assert error.details == {"status": 500}
+    
+    def test_service_helpers(self, tmp_path):
+        """Test audio validation and batch transcription."""
+        class DummyTranscriber(TranscriptionService):
+            calls = 0
+            
+            def transcribe(self, audio_file_path, options=None):
+                return TranscriptionResult(segments=[], language="en", duration=0.0,
+                                           metadata={"path": audio_file_path})
+            
+            def get_supported_formats(self):
+                DummyTranscriber.calls += 1
+                return ['.WAV', '.mp3']
+            
+            def get_supported_languages(self):
+                return []
+            
+            def is_available(self):
+                return True
+        
+        service = DummyTranscriber()
+        audio = tmp_path / "clip.wav"
+        audio.write_bytes(b"")
+        
+        assert service.validate_audio_file(audio)
+        assert not service.validate_audio_file(tmp_path / "missing.mp3")
+        assert service.validate_audio_file(tmp_path / "missing.mp3", check_exists=False)
+        assert not service.validate_audio_file(tmp_path / "clip.txt", check_exists=False)
+        assert DummyTranscriber.calls == 1
+        
+        assert service.transcribe_batch([]) == []
+        
+        paths = [tmp_path / f"{i}.wav" for i in range(5)]
+        results = service.transcribe_batch(paths, max_workers=3)
+        assert [result.metadata["path"] for result in results] == paths
+    
+    def test_filter_by_confidence_large(self):
+        """Test the vectorized confidence filter matches the scalar rule."""
+        confidences = [None, 0.2, 0.7, 0.9] * 100
+        result = TranscriptionResult(
+            segments=[
+                SubtitleSegment(str(i), start_time=i, end_time=i + 1, confidence=c)
+                for i, c in enumerate(confidences)
+            ],
+            language="en",
+            duration=400.0,
+        )
+        
+        filtered = result.filter_by_confidence(0.7)
+        
+        assert len(filtered.segments) == 300
+        assert all(s.confidence is None or s.confidence >= 0.7 for s in filtered.segments)
+        assert filtered.metadata is result.metadata
+        assert result.filter_by_confidence(0.7, copy_metadata=True).metadata is not result.metadata
+        
+        srt_stream, vtt_stream = io.StringIO(), io.StringIO()
+        result.write_srt(srt_stream)
+        result.write_vtt(vtt_stream)
+        assert srt_stream.getvalue() == result.to_srt()
+        assert vtt_stream.getvalue() == result.to_vtt()
+    
+    def test_transcription_options(self):
+        """Test option defaults and immutability."""
+        import dataclasses
+        
+        options = TranscriptionOptions(model="whisper-large-v3")
+        
+        assert options.timestamp_granularities == ("segment",)
+        assert options.model == "whisper-large-v3"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            options.model = "other"
+        
+        # Granularities given as a list are stored as a tuple, keeping options hashable
+        words = TranscriptionOptions(timestamp_granularities=["word", "segment"])
+        assert words.timestamp_granularities == ("word", "segment")
+        same = TranscriptionOptions(timestamp_granularities=("word", "segment"))
+        assert words == same and hash(words) == hash(same)
+    
+    def test_import_options(self):
+        """Test import options are hashable and their track mapping read-only."""
+        mapping = {"V1": "video"}
+        options = ImportOptions(track_mapping=mapping)
+        mapping["A1"] = "audio"  # The options keep their own copy
+        
+        assert options.track_mapping == {"V1": "video"}
+        with pytest.raises(TypeError):
+            options.track_mapping["A1"] = "audio"
+        assert hash(options) == hash(ImportOptions(track_mapping={"V1": "video"}))
+        assert hash(ImportOptions()) == hash(ImportOptions())
+        assert copy.deepcopy(options) == options
+    
+    def test_merge_short_segments(self):
+        """Test short segments merge into their successors."""
+        long_segment = SubtitleSegment("Long", start_time=3.0, end_time=6.0)
+        result = TranscriptionResult(
+            segments=[
+                SubtitleSegment("A", start_time=0.0, end_time=0.4, confidence=0.9),
+                SubtitleSegment("B", start_time=0.4, end_time=0.8),
+                SubtitleSegment("C", start_time=0.8, end_time=3.0, confidence=0.7),
+                long_segment,
+            ],
+            language="en",
+            duration=6.0,
+        )
+        
+        merged = result.merge_short_segments(min_duration=1.0)
+        
+        assert [s.text for s in merged.segments] == ["A B C", "Long"]
+        assert merged.segments[0].start_time == 0.0
+        assert merged.segments[0].end_time == 3.0
+        assert merged.segments[0].confidence == 0.7
+        assert merged.segments[1] is long_segment
+
+
+class TestTimelineFormat:
+    """Tests for TimelineFormat defaults."""
+    
+    def test_file_extensions(self):
+        """Test extensions follow the supported formats."""
+        formatter = DummyFormat([SupportedFormat.OTIO_JSON, SupportedFormat.EDL])
+        
+        assert formatter.get_file_extensions() == ['.otio', '.edl']
+        assert SupportedFormat.EDL == "edl"
+        assert SupportedFormat("edl") is SupportedFormat.EDL
+    
+    def test_validate_timeline(self):
+        """Test validation warns once about unsupported video clips."""
+        timeline = Timeline()
+        for _ in range(2):
+            track = timeline.add_track(track_type=TrackType.VIDEO)
+            track.add_clip(VideoClip("test.mp4", duration=2.0))
+        
+        audio_only = DummyFormat([SupportedFormat.EDL], FormatCapability(supports_video=False))
+        
+        assert audio_only.validate_timeline(timeline) == ["Format does not support video clips"]
+        assert DummyFormat([SupportedFormat.EDL]).validate_timeline(timeline) == []
+        
+        class PrimaryFormat(DummyFormat):
+            primary_format = SupportedFormat.EDL
+        
+        # The class attribute is used without listing the supported formats
+        assert PrimaryFormat(None, FormatCapability(supports_video=False)).validate_timeline(timeline) == [
+            "Format does not support video clips"
+        ]
+        assert DummyFormat([]).validate_timeline(Timeline()) == [
+            "Timeline has no tracks", "Timeline has zero duration"
+        ]
+
+
+class TestRenderOptions:
+    """Tests for RenderOptions class."""
+    
+    def test_render_options_round_trip(self):
+        """Test options survive dict conversion and pickling."""
+        import pickle
+        
+        options = RenderOptions(codec="libx265", threads=4)
+        restored = pickle.loads(pickle.dumps(options))
+        
+        assert restored.to_dict() == options.to_dict()
+        assert options.to_dict()['codec'] == "libx265"
+        assert options.to_dict()['threads'] == 4
+        assert 'logger' not in options.to_dict()
+    
+    def test_render_options_subclass_pickling(self):
+        """Test subclasses keep base slots, own slots and __dict__ through pickling."""
+        import pickle
+        
+        slotted = SlottedRenderOptions(codec="libvpx")
+        slotted.extra = "two-pass"
+        restored = pickle.loads(pickle.dumps(slotted))
+        assert restored.codec == "libvpx"
+        assert restored.extra == "two-pass"
+        
+        plain = PlainRenderOptions(threads=2)
+        plain.tag = "draft"
+        restored = pickle.loads(pickle.dumps(plain))
+        assert restored.threads == 2
+        assert restored.tag == "draft"
+
+
+class TestRenderQueue:
+    """Tests for RenderQueue class."""
+    
+    def test_parallel_thread_run(self):
+        """Test threaded processing runs every job exactly once."""
+        renderer = DummyRenderer(fail_on="bad")
+        queue = RenderQueue(default_renderer=renderer)
+        for i in range(10):
+            queue.add_job(Timeline(), f"out_{i}.mp4")
+        bad_id = queue.add_job(Timeline(), "bad.mp4")
+        
+        queue.run(QueueMode.PARALLEL_THREAD, workers=3)
+        
+        assert sorted(renderer.rendered) == sorted(f"out_{i}.mp4" for i in range(10))
+        assert queue.get_job(bad_id).status == JobStatus.FAILED
+        assert len(queue.list_jobs(JobStatus.COMPLETED)) == 10
+        assert all(job.duration >= 0.0 for job in queue.list_jobs())
+        assert queue.get_stats()['avg_duration'] is not None
+    
+    def test_remove_and_clear_completed(self):
+        """Test removing jobs keeps the remaining order intact."""
+        queue = RenderQueue(default_renderer=DummyRenderer(fail_on="bad"))
+        ids = [queue.add_job(Timeline(), f"out_{i}.mp4") for i in range(4)]
+        
+        assert len(set(ids)) == 4
+        assert all(len(job_id) == 22 for job_id in ids)
+        
+        assert queue.remove_job(ids[1])
+        assert not queue.remove_job(ids[1])
+        assert [job.id for job in queue.list_jobs()] == [ids[0], ids[2], ids[3]]
+        
+        queue.add_job(Timeline(), "bad.mp4")
+        queue.run()
+        stats = queue.get_stats()
+        assert stats['completed'] == 3
+        assert stats['failed'] == 1
+        
+        assert queue.clear_completed() == 4
+        assert len(queue) == 0
+        assert queue.get_stats()['completed'] == 0
+        assert queue.get_stats()['avg_duration'] is None
+    
+    def test_render_job_constructor(self):
+        """Test RenderJob keeps its original constructor arguments."""
+        job = RenderJob(
+            "job", Timeline(), Path("out.mp4"), DummyRenderer(), None, {"title": "Hi"},
+            error_message="x",
+        )
+        assert job.template_data == {"title": "Hi"}
+        assert job.error_message == "x"
+        assert job.status == JobStatus.PENDING
+        assert job.metadata == {}
+        
+        plain = RenderJob("plain", Timeline(), Path("out.mp4"), DummyRenderer())
+        assert plain.extras is None and plain.template_data is None
+    
+    def test_parallel_process_run(self):
+        """Test jobs render in worker processes and report back."""
+        queue = RenderQueue(default_renderer=DummyRenderer(fail_on="bad"))
+        good_id = queue.add_job(Timeline(), "out.mp4")
+        bad_id = queue.add_job(Timeline(), "bad.mp4")
+        
+        queue.run(QueueMode.PARALLEL_PROCESS, workers=2)
+        
+        assert queue.get_job(good_id).status == JobStatus.COMPLETED
+        assert queue.get_job(bad_id).status == JobStatus.FAILED
+        assert queue.get_job(good_id).extras is None
+        assert queue.get_job(bad_id).error_message == "Simulated failure"
+    
+    def test_parallel_process_shared_buffers(self):
+        """Test large array payloads reach worker processes intact."""
+        np = pytest.importorskip("numpy")
+        timeline = Timeline()
+        track = timeline.add_track(track_type=TrackType.VIDEO)
+        clip = VideoClip("test.mp4", duration=1.0)
+        clip.set_property("samples", np.ones(1 << 18))  # 2 MiB
+        track.add_clip(clip)
+        
+        queue = RenderQueue(default_renderer=SampleCheckRenderer())
+        job_ids = [queue.add_job(timeline, f"out_{i}.mp4") for i in range(2)]
+        queue.run(QueueMode.PARALLEL_PROCESS, workers=2)
+        
+        assert all(queue.get_job(job_id).status == JobStatus.COMPLETED for job_id in job_ids)
+    
+    def test_progress_callback_coalescing(self):
+        """Test rapid progress updates are coalesced."""
+        calls = []
+        callback = JobProgressCallback(calls.append, min_interval=60.0, min_delta=10.0)
+        queue = RenderQueue(default_renderer=DummyRenderer())
+        job = queue.get_job(queue.add_job(Timeline(), "out.mp4"))
+        
+        callback.on_job_progress(job, 10.0)  # Fires: first update
+        callback.on_job_progress(job, 10.5)
+        callback.on_job_progress(job, 15.0)
+        callback.on_job_progress(job, 20.0)  # Fires: advanced 10%
+        callback.on_job_progress(job, 100.0)  # Fires: finished
+        
+        assert len(calls) == 3
+        assert job.progress == 100.0
+    
+    def test_wait_for_completion(self):
+        """Test waiting on a queue running in another thread."""
+        import threading
+        
+        queue = RenderQueue(default_renderer=DummyRenderer())
+        for i in range(5):
+            queue.add_job(Timeline(), f"out_{i}.mp4")
+        
+        runner = threading.Thread(target=queue.run, args=(QueueMode.PARALLEL_THREAD, 2))
+        runner.start()
+        assert queue.wait_for_completion(timeout=10.0)
+        runner.join()
+        
+        stats = queue.get_stats()
+        assert stats['completed'] == 5
+        assert stats['pending'] == stats['running'] == 0
+    
+    def test_run_validates_workers(self):
+        """Test invalid worker counts are rejected and one worker runs inline."""
+        renderer = DummyRenderer()
+        queue = RenderQueue(default_renderer=renderer)
+        queue.add_job(Timeline(), "out.mp4")
+        
+        with pytest.raises(ValueError):
+            queue.run(QueueMode.PARALLEL_THREAD, workers=0)
+        
+        queue.run(QueueMode.PARALLEL_PROCESS, workers=4)
+        assert renderer.rendered == ["out.mp4"]  # Single job rendered in-process
+    
+    def test_stop_from_callback(self):
+        """Test stopping the queue lets running jobs finish but starts no more."""
+        queue = RenderQueue(default_renderer=DummyRenderer())
+        for i in range(6):
+            queue.add_job(Timeline(), f"out_{i}.mp4")
+        queue.progress_callback.callback = lambda job: queue.stop()
+        
+        queue.run(QueueMode.PARALLEL_THREAD, workers=2)
+        
+        stats = queue.get_stats()
+        assert stats['completed'] == 2
+        assert stats['pending'] == 4
+        assert not stats['queue_running']
+    
+    def test_template_job_data_digest(self):
+        """Test template jobs can keep a digest instead of the fill data."""
+        template = VideoTemplate.create_simple_text_template("Title Card")
+        queue = RenderQueue(default_renderer=DummyRenderer())
+        data = {"title": "Hello"}
+        
+        stored = queue.get_job(queue.add_template_job(template, data, "a.mp4"))
+        hashed = queue.get_job(queue.add_template_job(
+            template, data, "b.mp4", store_template_data=False
+        ))
+        
+        assert stored.metadata['template_data'] is data
+        assert 'template_data' not in hashed.metadata
+        assert len(hashed.metadata['template_data_hash']) == 32
+        assert hashed.metadata['template_name'] == "Title Card"
+
+
+def make_title_template():
+    """Build a template with a title and a video placeholder over stand-in clips."""
+    timeline = Timeline()
+    timeline.add_track(track_type=TrackType.VIDEO).add_clip(VideoClip("stand_in.mp4", duration=5.0))
+    timeline.add_track(track_type=TrackType.TEXT).add_clip(TextClip("Title", duration=5.0))
+    
+    template = VideoTemplate(timeline)
+    template.add_placeholder(PlaceholderVideo("video", duration=5.0), 0, 0)
+    template.add_placeholder(PlaceholderText("title", duration=5.0, max_length=10), 1, 0)
+    return template
+
+
+class TestVideoTemplate:
+    """Tests for VideoTemplate class."""
+    
+    def test_fill_replaces_placeholders(self):
+        """Test filling swaps placeholder clips and leaves the template intact."""
+        template = make_title_template()
+        
+        filled = template.fill({"video": "clip.mov", "title": "Hello"})
+        
+        assert filled.tracks[0].clips[0].source_path == Path("clip.mov")
+        assert filled.tracks[1].clips[0].text == "Hello"
+        assert template.timeline.tracks[0].clips[0].source_path == Path("stand_in.mp4")
+    
+    def test_compiled_fill(self):
+        """Test a compiled fill function can be reused across data sets."""
+        template = make_title_template()
+        fill = template.compile()
+        
+        first = fill({"video": "a.mp4", "title": "One"})
+        second = fill({"video": "b.mp4", "title": "Two"})
+        
+        assert first.tracks[1].clips[0].text == "One"
+        assert second.tracks[1].clips[0].text == "Two"
+        assert first.tracks[0].clips[0] is not second.tracks[0].clips[0]
+        with pytest.raises(ValueError, match="Missing required placeholder: video"):
+            fill({"title": "Three"}, collect_all_errors=True)
+        
+        batch = template.fill_many({"video": f"{i}.mp4", "title": str(i)} for i in range(3))
+        assert [timeline.tracks[1].clips[0].text for timeline in batch] == ["0", "1", "2"]
+    
+    def test_fill_copies_other_clips(self):
+        """Test clips that are not placeholders are copied, not shared."""
+        template = make_title_template()
+        background = AudioClip("music.mp3", duration=5.0)
+        background.set_property("mood", "calm")
+        template.timeline.add_clip(background)
+        
+        filled = template.fill({"video": "clip.mov", "title": "Hello"})
+        copied = filled.tracks[2].clips[0]
+        copied.set_property("mood", "loud")
+        copied.duration = 8.0
+        
+        assert copied is not background
+        assert background.get_property("mood") == "calm"
+        assert filled.tracks[2].find_clips_at_time(6.0) == [copied]
+        assert template.timeline.tracks[2].find_clips_at_time(6.0) == []
+        
+        # Immutable value types are shared rather than copied
+        assert filled.tracks[1].clips[0].position is template.get_placeholder("title").position
+        with pytest.raises(AttributeError):
+            copied_position = filled.tracks[0].clips[0].position
+            copied_position.x = 10
+    
+    def test_required_keys_follow_placeholders(self):
+        """Test required keys are refreshed when placeholders change."""
+        template = make_title_template()
+        assert template.get_required_data_keys() == ["video", "title"]
+        
+        template.add_placeholder(PlaceholderText("caption", duration=5.0, required=False), 1)
+        template.remove_placeholder("video")
+        
+        assert template.get_required_data_keys() == ["title"]
+        assert template.list_placeholders() == ["title", "caption"]
+        
+        filled = template.fill({"title": "Hello", "caption": "Sub"})
+        assert filled.tracks[1].clips[0].text == "Hello"
+    
+    def test_text_placeholder_data_shapes(self):
+        """Test text placeholders accept strings, dicts, or nothing when optional."""
+        placeholder = PlaceholderText("title", duration=2.0, font_size=30, required=False)
+        
+        assert placeholder.create_clip({"title": "Hi"}).text == "Hi"
+        assert placeholder.create_clip({"title": 42}).text == "42"
+        
+        styled = placeholder.create_clip({"title": {"text": "Hi", "color": {"r": 1, "g": 2, "b": 3}}})
+        assert styled.color == Color(1, 2, 3)
+        assert styled.font_size == 30
+        
+        missing = placeholder.create_clip({})
+        assert missing.text == ""
+        assert missing.font_size == 30
+    
+    def test_video_format_check_ignores_case(self):
+        """Test allowed formats match extensions regardless of case."""
+        placeholder = PlaceholderVideo("video", allowed_formats=[".MP4"])
+        
+        assert placeholder.validate_data({"video": "clip.mp4"}) == []
+        assert placeholder.validate_data({"video": {"path": "CLIP.Mp4"}}) == []
+        assert placeholder.validate_data({"video": "clip.mov"}) == ["Invalid format for video. Allowed: .MP4"]
+    
+    def test_fill_error_reporting(self):
+        """Test fill stops at the first error unless asked to collect them all."""
+        template = make_title_template()
+        data = {"video": "clip.txt", "title": "Far too long"}
+        
+        with pytest.raises(ValueError, match="Invalid format") as first_only:
+            template.fill(data)
+        assert "maximum length" not in str(first_only.value)
+        
+        with pytest.raises(ValueError, match="maximum length"):
+            template.fill(data, collect_all_errors=True)
+    
+    def test_library_search(self):
+        """Test searching templates by name, tags, and description."""
+        library = TemplateLibrary()
+        library.add_template(VideoTemplate(Timeline(), TemplateInfo("Intro", "Opening card", tags=["Brand"])))
+        outro_info = TemplateInfo("Outro", "Closing brand card")
+        outro_info.tags.append("Social")
+        library.add_template(VideoTemplate(Timeline(), outro_info))
+        
+        assert library.search_templates("INTRO") == ["Intro"]
+        assert library.search_templates("brand") == ["Intro", "Outro"]
+        assert library.search_templates("brand", search_description=False) == ["Intro"]
+        assert library.search_templates("card", search_description=False) == []
+        assert library.search_templates("social") == ["Outro"]
+        
+        library.add_template(VideoTemplate(Timeline(), TemplateInfo("Straße", "Street scene")))
+        assert library.search_templates("STRASSE") == ["Straße"]